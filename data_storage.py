@@ -6,42 +6,340 @@ This module handles the storage and retrieval of historical system resource data
 import os
 import sqlite3
 import json
+import time
+import threading
+from array import array
+from functools import lru_cache
 from datetime import datetime, timedelta
 
+# Prefer orjson (C implementation) for the per-sample hot path
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional columnar archive support for history beyond the live window
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    DUCKDB_AVAILABLE = False
+
+# Optional zstd compression for the per-sample JSON blob
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Standard zstd frame magic, used to recognize compressed rows so
+# databases written with and without zstandard stay readable
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+if ZSTD_AVAILABLE:
+    _zstd_compressor = zstandard.ZstdCompressor(level=3)
+    _zstd_decompressor = zstandard.ZstdDecompressor()
+
+
+def _json_dumps(data):
+    """Serialize data to a JSON string using the fastest available codec."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
+
+def _json_loads(raw):
+    """Parse a JSON string using the fastest available codec."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _encode_sample(data):
+    """Serialize a sample for the data_json column, compressed if possible."""
+    if ZSTD_AVAILABLE:
+        raw = (orjson.dumps(data) if ORJSON_AVAILABLE
+               else json.dumps(data).encode())
+        return _zstd_compressor.compress(raw)
+    return _json_dumps(data)
+
+
+def _decode_sample(blob):
+    """Parse a data_json value written by any build of this module."""
+    if isinstance(blob, bytes) and blob.startswith(_ZSTD_MAGIC):
+        blob = _zstd_decompressor.decompress(blob)
+    return _json_loads(blob)
+
+
+# Table DDL shared by first-time creation and the legacy rebuild in
+# _migrate_text_timestamps; timestamp must be declared INTEGER so the
+# column keeps integer affinity
+_METRICS_TABLE_DDL = '''
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp INTEGER NOT NULL,
+        cpu_percent REAL,
+        memory_percent REAL,
+        disk_percent REAL,
+        disk_read_bytes REAL,
+        disk_write_bytes REAL,
+        network_sent_speed REAL,
+        network_recv_speed REAL,
+        data_json TEXT
+    )
+'''
+
+
+# Single canonical INSERT text: sqlite3's statement cache is keyed by
+# the exact SQL string, so every flush reuses the same prepared plan
+_INSERT_SQL = '''
+    INSERT INTO system_metrics (
+        timestamp, cpu_percent, memory_percent, disk_percent,
+        disk_read_bytes, disk_write_bytes, network_sent_speed,
+        network_recv_speed, data_json
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+@lru_cache(maxsize=64)
+def _metric_extractor(metric):
+    """Build a specialized extractor for a dotted JSON metric path."""
+    keys = tuple(metric.split('.'))
+
+    def extract(data):
+        for key in keys:
+            data = data[key]
+        return data
+
+    return extract
+
+
+def _epoch_us(dt=None):
+    """Convert a datetime (or now) to integer epoch microseconds."""
+    if dt is None:
+        return int(time.time() * 1_000_000)
+    return int(dt.timestamp() * 1_000_000)
+
+
+def _epoch_us_to_iso(ts):
+    """Convert integer epoch microseconds back to an ISO-8601 string."""
+    return datetime.fromtimestamp(ts / 1_000_000).isoformat()
+
+
+def _coerce_epoch_us(value):
+    """Convert a legacy timestamp (ISO text or digit text) to an int."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return _epoch_us(datetime.fromisoformat(value))
+
 
 class DataStorage:
     """Stores and retrieves historical system resource data."""
     
-    def __init__(self, db_path='system_monitor.db'):
-        """Initialize the data storage with an SQLite database."""
+    # Buffer this many samples before writing them in one transaction
+    FLUSH_INTERVAL = 50
+    # Run old-data cleanup once per this many inserts, not per insert
+    CLEANUP_INTERVAL = 1000
+    # ... but never let more than this many seconds pass without one,
+    # so slow samplers still expire old rows on time
+    CLEANUP_MAX_AGE = 600
+    # Run WAL checkpoint / optimize maintenance once per this many inserts
+    MAINTENANCE_INTERVAL = 1000
+
+    # Metrics stored as dedicated columns (anything else lives in data_json)
+    COLUMN_METRICS = ('cpu_percent', 'memory_percent', 'disk_percent',
+                      'disk_read_bytes', 'disk_write_bytes',
+                      'network_sent_speed', 'network_recv_speed')
+
+    # Per-metric history queries built once so sqlite3's statement cache
+    # sees identical SQL text on every call
+    _HISTORY_STMTS = {
+        metric: '''
+            SELECT timestamp, {}
+            FROM system_metrics
+            WHERE timestamp >= ?
+            ORDER BY timestamp DESC
+            LIMIT ?
+        '''.format(metric)
+        for metric in COLUMN_METRICS
+    }
+
+    def __init__(self, db_path='system_monitor.db', store_json=True,
+                 archive_dir=None):
+        """
+        Initialize the data storage with an SQLite database.
+
+        Args:
+            db_path (str): Path to the SQLite database file
+            store_json (bool): Whether to keep the full sample as JSON.
+                The key metrics are promoted to columns either way, so
+                disabling this skips serialization entirely per sample.
+            archive_dir (str): Directory for columnar Parquet archives of
+                expired rows. Requires pyarrow; when unset (or pyarrow is
+                missing) expired rows are simply deleted as before.
+        """
         self.db_path = db_path
-        self.connection = sqlite3.connect(db_path)
-        self.cursor = self.connection.cursor()
+        self.store_json = store_json
+        self.archive_dir = archive_dir if PYARROW_AVAILABLE else None
+        if self.archive_dir:
+            os.makedirs(self.archive_dir, exist_ok=True)
+        # The UI thread reads while background threads write; sqlite3
+        # connections must not be shared across threads, so each thread
+        # lazily opens its own (WAL lets them run concurrently)
+        self._local = threading.local()
+        self._connections = []
+        self._conn_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pending = []
+        self._insert_count = 0
+        self._last_cleanup = time.monotonic()
         self._create_tables()
+
+    def _conn(self):
+        """Get (or lazily open) this thread's database connection."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            # isolation_level=None puts sqlite3 in autocommit mode; batch
+            # writes drive their own BEGIN IMMEDIATE/COMMIT explicitly
+            connection = sqlite3.connect(self.db_path,
+                                         cached_statements=512,
+                                         isolation_level=None,
+                                         check_same_thread=False)
+            self._configure_connection(connection)
+            self._local.connection = connection
+            with self._conn_lock:
+                self._connections.append(connection)
+        return connection
+
+    def _analytics_conn(self):
+        """
+        Get (or lazily open) this thread's DuckDB analytics connection.
+
+        DuckDB executes analytical scans vectorized, so when it is
+        installed the read-heavy history queries go through it while all
+        writes stay on sqlite3. Returns None when unavailable.
+        """
+        if not DUCKDB_AVAILABLE:
+            return None
+
+        connection = getattr(self._local, 'analytics', None)
+        if connection is None and not getattr(self._local, 'analytics_failed',
+                                              False):
+            try:
+                connection = duckdb.connect()
+                connection.execute('INSTALL sqlite; LOAD sqlite')
+                connection.execute(
+                    "ATTACH '{}' AS mon (TYPE sqlite, READ_ONLY)".format(
+                        self.db_path)
+                )
+                self._local.analytics = connection
+            except Exception:
+                # Extension missing or attach failed: remember and fall
+                # back to plain sqlite3 reads on this thread
+                self._local.analytics_failed = True
+                return None
+        return connection
+
+    def _configure_connection(self, connection):
+        """Tune SQLite for a write-heavy monitoring workload."""
+        # WAL lets readers proceed while the sampler is writing, and
+        # synchronous=NORMAL avoids a full fsync on every commit
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute('PRAGMA temp_store=MEMORY')
+        connection.execute('PRAGMA cache_size=-20000')
+        connection.execute('PRAGMA busy_timeout=5000')
+
+    def _run_maintenance(self):
+        """Bound WAL file growth and refresh query planner statistics."""
+        try:
+            connection = self._conn()
+            connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            connection.execute('PRAGMA optimize')
+        except sqlite3.Error:
+            # Maintenance is best-effort; never let it break data collection
+            pass
     
     def _create_tables(self):
         """Create the necessary tables if they don't exist."""
+        connection = self._conn()
+
         # Create a table for the system metrics
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS system_metrics (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT NOT NULL,
-                cpu_percent REAL,
-                memory_percent REAL,
-                disk_percent REAL,
-                disk_read_bytes REAL,
-                disk_write_bytes REAL,
-                network_sent_speed REAL,
-                network_recv_speed REAL,
-                data_json TEXT
-            )
+        connection.execute(_METRICS_TABLE_DDL.format(table='system_metrics'))
+
+        # Index the timestamp so history queries and cleanup do range
+        # scans instead of full table scans
+        connection.execute('''
+            CREATE INDEX IF NOT EXISTS idx_metrics_ts
+            ON system_metrics(timestamp DESC)
         ''')
-        self.connection.commit()
-    
+
+        self._migrate_text_timestamps()
+
+    def _migrate_text_timestamps(self):
+        """Rebuild legacy tables that declared the timestamp as TEXT."""
+        connection = self._conn()
+
+        # CREATE TABLE IF NOT EXISTS cannot change an existing schema,
+        # and a column declared TEXT coerces every integer written into
+        # it back to TEXT, so converting the stored values in place is
+        # not enough: the table itself has to be rebuilt around an
+        # INTEGER timestamp column
+        declared = next(
+            (row[2] for row in connection.execute(
+                'PRAGMA table_info(system_metrics)')
+             if row[1] == 'timestamp'),
+            '')
+        if declared.upper() == 'INTEGER':
+            return
+
+        other_columns = ', '.join(self.COLUMN_METRICS + ('data_json',))
+        placeholders = ', '.join('?' * (len(self.COLUMN_METRICS) + 2))
+
+        def converted(rows):
+            for row in rows:
+                try:
+                    yield (_coerce_epoch_us(row[0]),) + tuple(row[1:])
+                except (TypeError, ValueError):
+                    # Drop rows nothing can parse rather than letting
+                    # them poison integer comparisons forever
+                    continue
+
+        with connection:
+            connection.execute(
+                'ALTER TABLE system_metrics RENAME TO system_metrics_legacy')
+            connection.execute(_METRICS_TABLE_DDL.format(table='system_metrics'))
+
+            legacy = connection.execute(
+                'SELECT timestamp, {} FROM system_metrics_legacy ORDER BY id'
+                .format(other_columns))
+            connection.executemany(
+                'INSERT INTO system_metrics (timestamp, {}) VALUES ({})'
+                .format(other_columns, placeholders), converted(legacy))
+
+            # The index followed the renamed table and goes down with
+            # it; recreate it on the rebuilt one
+            connection.execute('DROP TABLE system_metrics_legacy')
+            connection.execute('''
+                CREATE INDEX IF NOT EXISTS idx_metrics_ts
+                ON system_metrics(timestamp DESC)
+            ''')
+
     def store_data(self, data):
         """Store the current system data in the database."""
+        # Integer timestamps keep comparisons and the index cheap
+        timestamp = _epoch_us()
+
         # Extract key metrics for quick access
-        timestamp = data['timestamp']
         cpu_percent = data['cpu']['percent']
         memory_percent = data['memory']['percent']
         disk_percent = data['disk']['percent']
@@ -51,34 +349,109 @@ class DataStorage:
         network_recv_speed = data['network']['recv_speed']
         
         # Store the full data as JSON for future use
-        data_json = json.dumps(data)
-        
-        # Insert the data into the database
-        self.cursor.execute('''
-            INSERT INTO system_metrics (
-                timestamp, cpu_percent, memory_percent, disk_percent,
-                disk_read_bytes, disk_write_bytes, network_sent_speed,
-                network_recv_speed, data_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        data_json = _encode_sample(data) if self.store_json else None
+
+        # Buffer the row; it is written on the next flush
+        self._pending.append((
             timestamp, cpu_percent, memory_percent, disk_percent,
             disk_read_bytes, disk_write_bytes, network_sent_speed,
             network_recv_speed, data_json
         ))
-        self.connection.commit()
-        
-        # Clean up old data (keep only the last 24 hours by default)
-        self._cleanup_old_data()
+        if len(self._pending) >= self.FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        """Write all buffered samples in a single transaction."""
+        # Only one thread writes a given batch; others wait so their
+        # subsequent reads see the flushed rows
+        with self._write_lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, []
+
+            connection = self._conn()
+
+            # One explicit transaction for the whole batch; IMMEDIATE takes
+            # the write lock up front instead of upgrading mid-batch
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                connection.executemany(_INSERT_SQL, batch)
+                connection.execute('COMMIT')
+            except sqlite3.Error:
+                connection.execute('ROLLBACK')
+                raise
+
+            self._insert_count += len(batch)
+
+        # Periodic housekeeping instead of per-insert work; a wall-clock
+        # bound covers samplers that insert too slowly to hit the counter
+        now = time.monotonic()
+        if (self._insert_count % self.CLEANUP_INTERVAL < self.FLUSH_INTERVAL
+                or now - self._last_cleanup > self.CLEANUP_MAX_AGE):
+            # Clean up old data (keep only the last 24 hours by default)
+            self._cleanup_old_data()
+            self._last_cleanup = now
+        if self._insert_count % self.MAINTENANCE_INTERVAL < self.FLUSH_INTERVAL:
+            self._run_maintenance()
     
     def _cleanup_old_data(self, hours=24):
         """Remove data older than the specified number of hours."""
-        cutoff_time = (datetime.now() - timedelta(hours=hours)).isoformat()
-        
-        self.cursor.execute('''
+        cutoff_time = int((time.time() - hours * 3600) * 1_000_000)
+
+        if self.archive_dir:
+            self._archive_expired_rows(cutoff_time)
+
+        self._conn().execute('''
             DELETE FROM system_metrics
             WHERE timestamp < ?
         ''', (cutoff_time,))
-        self.connection.commit()
+
+    def _archive_expired_rows(self, cutoff_time):
+        """Roll rows that are about to expire into a daily Parquet file."""
+        columns = ('timestamp',) + self.COLUMN_METRICS
+        rows = self._conn().execute('''
+            SELECT {} FROM system_metrics
+            WHERE timestamp < ?
+            ORDER BY timestamp
+        '''.format(', '.join(columns)), (cutoff_time,)).fetchall()
+        if not rows:
+            return
+
+        try:
+            # One column per metric compresses far better than row JSON
+            table = pa.table(
+                {name: [row[i] for row in rows]
+                 for i, name in enumerate(columns)}
+            )
+            day = datetime.fromtimestamp(rows[0][0] / 1_000_000)
+            filename = 'metrics-{}-{}.parquet'.format(
+                day.strftime('%Y%m%d'), rows[0][0]
+            )
+            pq.write_table(table, os.path.join(self.archive_dir, filename),
+                           compression='snappy')
+        except Exception:
+            # Archiving is best-effort; the live window is unaffected
+            pass
+
+    def _query_archive(self, metric, cutoff_time, limit):
+        """Query archived Parquet files for a column metric via DuckDB."""
+        if not (self.archive_dir and DUCKDB_AVAILABLE):
+            return []
+
+        pattern = os.path.join(self.archive_dir, '*.parquet')
+        try:
+            rows = duckdb.sql('''
+                SELECT timestamp, {} FROM read_parquet('{}')
+                WHERE timestamp >= ?
+                ORDER BY timestamp DESC
+                LIMIT ?
+            '''.format(metric, pattern), params=(cutoff_time, limit)).fetchall()
+        except Exception:
+            # No archive files yet, or an unreadable file: fall back to
+            # whatever the live window can answer
+            return []
+
+        return [(_epoch_us_to_iso(row[0]), row[1]) for row in rows]
     
     def get_history(self, metric, hours=1, limit=60):
         """
@@ -92,63 +465,134 @@ class DataStorage:
         Returns:
             list: List of (timestamp, value) tuples
         """
-        cutoff_time = (datetime.now() - timedelta(hours=hours)).isoformat()
-        
-        if metric in ['cpu_percent', 'memory_percent', 'disk_percent',
-                      'disk_read_bytes', 'disk_write_bytes',
-                      'network_sent_speed', 'network_recv_speed']:
-            # Direct database columns
-            self.cursor.execute(f'''
-                SELECT timestamp, {metric}
-                FROM system_metrics
-                WHERE timestamp >= ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-            ''', (cutoff_time, limit))
-            
-            return [(row[0], row[1]) for row in self.cursor.fetchall()]
+        # Make buffered samples visible to the query
+        self.flush()
+
+        cutoff_time = int((time.time() - hours * 3600) * 1_000_000)
+
+        if metric in self._HISTORY_STMTS:
+            # Direct database columns; iterate the cursor instead of
+            # materializing an intermediate fetchall() list
+            cursor = self._conn().execute(self._HISTORY_STMTS[metric],
+                                          (cutoff_time, limit))
+
+            result = [(_epoch_us_to_iso(ts), value) for ts, value in cursor]
+
+            # Requests beyond the live window continue into the archive
+            if hours > 24 and len(result) < limit:
+                result.extend(self._query_archive(
+                    metric, cutoff_time, limit - len(result)
+                ))
+
+            return result
         else:
             # For metrics stored in the JSON data
-            self.cursor.execute('''
+            # This assumes the metric is in the format 'category.name'
+            if '.' not in metric:
+                return []
+
+            # The dotted path is known up front, so resolve it through a
+            # cached specialized extractor instead of dict-walking per row
+            extract = _metric_extractor(metric)
+
+            cursor = self._conn().execute('''
                 SELECT timestamp, data_json
                 FROM system_metrics
                 WHERE timestamp >= ?
                 ORDER BY timestamp DESC
                 LIMIT ?
             ''', (cutoff_time, limit))
-            
+
             result = []
-            for row in self.cursor.fetchall():
-                timestamp = row[0]
-                data = json.loads(row[1])
-                
-                # Extract the requested metric from the JSON data
-                # This assumes the metric is in the format 'category.name'
-                if '.' in metric:
-                    category, name = metric.split('.', 1)
-                    if category in data and name in data[category]:
-                        result.append((timestamp, data[category][name]))
-            
+            for ts, blob in cursor:
+                if blob is None:
+                    continue
+                try:
+                    value = extract(_decode_sample(blob))
+                except (KeyError, TypeError):
+                    continue
+                result.append((_epoch_us_to_iso(ts), value))
+
             return result
     
+    def get_history_arrays(self, metric, hours=1, limit=60):
+        """
+        Get historical data for a column metric as two parallel arrays.
+
+        Chart code that only needs contiguous numeric buffers can use
+        this instead of get_history and skip per-point tuple and ISO
+        string allocation entirely.
+
+        Args:
+            metric (str): A column metric name (see COLUMN_METRICS)
+            hours (int): Number of hours of history to retrieve
+            limit (int): Maximum number of data points to return
+
+        Returns:
+            tuple: (timestamps, values) as array('q') epoch microseconds
+                and array('d') values, both newest first
+        """
+        if metric not in self._HISTORY_STMTS:
+            raise ValueError(f"Not a column metric: {metric}")
+
+        # Make buffered samples visible to the query
+        self.flush()
+
+        cutoff_time = int((time.time() - hours * 3600) * 1_000_000)
+
+        # Prefer the vectorized DuckDB scan when available
+        analytics = self._analytics_conn()
+        if analytics is not None:
+            try:
+                rows = analytics.execute('''
+                    SELECT timestamp, {}
+                    FROM mon.system_metrics
+                    WHERE timestamp >= ?
+                    ORDER BY timestamp DESC
+                    LIMIT ?
+                '''.format(metric), (cutoff_time, limit)).fetchall()
+            except Exception:
+                rows = None
+            if rows is not None:
+                timestamps = array('q', (row[0] for row in rows))
+                values = array('d', (row[1] if row[1] is not None else 0.0
+                                     for row in rows))
+                return timestamps, values
+
+        cursor = self._conn().execute(self._HISTORY_STMTS[metric],
+                                      (cutoff_time, limit))
+
+        timestamps = array('q')
+        values = array('d')
+        for ts, value in cursor:
+            timestamps.append(ts)
+            values.append(value if value is not None else 0.0)
+
+        return timestamps, values
+
     def get_recent_data(self):
         """Get the most recent data point."""
-        self.cursor.execute('''
+        # Make buffered samples visible to the query
+        self.flush()
+
+        row = self._conn().execute('''
             SELECT data_json
             FROM system_metrics
             ORDER BY timestamp DESC
             LIMIT 1
-        ''')
-        
-        row = self.cursor.fetchone()
-        if row:
-            return json.loads(row[0])
+        ''').fetchone()
+        if row and row[0] is not None:
+            return _decode_sample(row[0])
         return None
     
     def close(self):
-        """Close the database connection."""
-        if self.connection:
-            self.connection.close()
+        """Flush any buffered samples and close all database connections."""
+        self.flush()
+        with self._conn_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local = threading.local()
 
 
 if __name__ == '__main__':
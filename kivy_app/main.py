@@ -48,21 +48,15 @@ class ElAIApp(App):
     
     # App information
     version = StringProperty('0.1.0')
-    
+
+    # Data loading state (class-level defaults, set per-instance on use)
+    _data_loaded = False
+    _loading_thread = None
+
     def __init__(self, **kwargs):
         """Initialize the application."""
         super(ElAIApp, self).__init__(**kwargs)
-        
-        # Initialize component managers
-        self.model_handler = ModelHandler()
-        self.file_manager = FileManager()
-        self.notification_manager = NotificationManager()
-        self.sanskrit_nlp = SanskritNLP()
-        
-        # Set up data loading flag
-        self._data_loaded = False
-        self._loading_thread = None
-        
+
         # For Android, set the window to fullscreen
         if platform == 'android':
             Window.fullscreen = 'auto'
@@ -77,18 +71,10 @@ class ElAIApp(App):
     def _load_data_thread(self):
         """Background thread for loading data."""
         try:
-            # Initialize the model handler (this might take time)
+            # Pre-warm the model used last session so the first Generate
+            # doesn't pay the client handshake
             try:
-                # Try to load any saved API keys
-                # This is a placeholder - in a real app you'd load from secure storage
-                api_keys = {}
-                
-                # Initialize models if API keys are available
-                if api_keys.get('openai'):
-                    self.model_handler.initialize_openai(api_keys['openai'])
-                
-                if api_keys.get('gemma'):
-                    self.model_handler.initialize_gemma(api_keys['gemma'])
+                self.model_handler.warm_last_used()
             except Exception as e:
                 Logger.error(f"Failed to initialize models: {e}")
             
@@ -116,11 +102,43 @@ class ElAIApp(App):
     
     def build(self):
         """Build the application UI."""
+        # Construct the component managers here rather than in __init__
+        # so importing/instantiating the app class stays cheap
+        self.model_handler = ModelHandler()
+        self.file_manager = FileManager()
+        self.notification_manager = NotificationManager()
+        self.sanskrit_nlp = SanskritNLP()
+
         # Create the screen manager
         self.screen_manager = ScreenManager(transition=SlideTransition())
-        
-        # Add screens
+
+        # Only the screen visible at startup is built before the first
+        # frame; the rest are added right after it paints so cold start
+        # is not the sum of every screen's construction time
         self.screen_manager.add_widget(HomeScreen(name='home'))
+        Clock.schedule_once(self._add_remaining_screens, 0)
+
+        # Schedule loading of initial data
+        Clock.schedule_once(self._load_initial_data, 0.5)
+
+        # Warm image caches once startup has settled
+        Clock.schedule_once(self._preload_assets, 1)
+
+        return self.screen_manager
+
+    def _preload_assets(self, dt):
+        """Decode shared images into Kivy's cache during idle time."""
+        # The About screen's logo would otherwise be decoded on the UI
+        # thread the first time that screen opens — a visible hitch;
+        # CoreImage populates the texture cache so it's served instantly
+        try:
+            from kivy.core.image import Image as CoreImage
+            CoreImage('resources/app_icon.png')
+        except Exception as e:
+            Logger.warning(f"Asset preload failed: {e}")
+
+    def _add_remaining_screens(self, dt):
+        """Add the screens that aren't needed for the first frame."""
         self.screen_manager.add_widget(SanskritScreen(name='sanskrit'))
         self.screen_manager.add_widget(CodeGenerationScreen(name='code_generation'))
         self.screen_manager.add_widget(RepositoryScreen(name='repository'))
@@ -129,17 +147,18 @@ class ElAIApp(App):
         self.screen_manager.add_widget(SettingsScreen(name='settings'))
         self.screen_manager.add_widget(AboutScreen(name='about'))
         self.screen_manager.add_widget(InstructionScreen(name='instruction'))
-        
-        # Schedule loading of initial data
-        Clock.schedule_once(self._load_initial_data, 0.5)
-        
-        return self.screen_manager
     
     def on_stop(self):
         """Clean up resources when the app is closing."""
         # Save any unsaved data
         # For example, save settings, recent files, etc.
         
+        # Flush debounced config changes and stop the worker pool
+        try:
+            self.model_handler.shutdown()
+        except:
+            pass
+
         # Clean up any open resources
         try:
             # Clean temp files older than 7 days
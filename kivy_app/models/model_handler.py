@@ -1,15 +1,26 @@
 """
 Model Handler Module.
 This module is responsible for managing AI model interactions and API calls.
+
+Heavy SDKs (openai, qiskit, ...) must never be imported at module scope:
+this module is pulled in during app startup, and their import cost lands
+directly on cold start. Import them inside the initialize_* method that
+needs them.
 """
 
 import os
 import json
-import time
+import pickle
+import inspect
+import weakref
 import threading
-from typing import Dict, Any, Optional, List, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Optional, List, Union
 from enum import Enum
 
+from kivy.clock import Clock
 from kivy.logger import Logger
 
 
@@ -19,21 +30,466 @@ class ModelType(Enum):
     GEMMA = "gemma"
     QISKIT = "qiskit"
 
+    def __init__(self, value):
+        # Position in definition order, used to index the handler's
+        # slot list without a dict probe
+        self.index = len(type(self).__members__)
+
+    @classmethod
+    def from_string(cls, value: str) -> Optional['ModelType']:
+        """
+        Look up a ModelType by its string value.
+
+        Args:
+            value (str): The model name, e.g. 'chatgpt'
+
+        Returns:
+            ModelType: The matching member, or None if unknown
+        """
+        # Dict probe instead of the Enum __call__ machinery, which
+        # scans members linearly and raises ValueError on a miss
+        return _STR_TO_TYPE.get(value)
+
+
+# Prebuilt once at import so from_string is an O(1) lookup with no
+# exception construction on unknown names
+_STR_TO_TYPE = {member.value: member for member in ModelType}
+
+
+@dataclass(frozen=True, slots=True)
+class ModelSlot:
+    """Immutable per-model state published atomically by the handler."""
+    initialized: bool = False
+    api_key: Optional[str] = None
+    client: Any = None
+    local_path: Optional[str] = None
+    mode: Optional[str] = None
+
+
+class _ModelStatus:
+    """
+    Mutable per-model status record.
+
+    A __slots__ class instead of a two-key dict: transitions mutate in
+    place rather than allocating a fresh dict, and reads are attribute
+    loads instead of string-key hashing.
+    """
+    __slots__ = ('status', 'error')
+
+    def __init__(self, status: str = 'not_initialized',
+                 error: Optional[str] = None):
+        self.status = status
+        self.error = error
+
+
+# Shared read-only sentinel for the status miss path; polling callers
+# would otherwise allocate (and immediately discard) a fresh dict per
+# frame. The proxy keeps callers from mutating the shared instance.
+_INVALID_STATUS = MappingProxyType({
+    "initialized": False,
+    "status": "error",
+    "error": "Invalid model type",
+    "api_key": None,
+    "client": None,
+    "local_path": None,
+    "mode": None,
+})
+
 
 class ModelHandler:
     """Handles interactions with various AI models."""
-    
-    def __init__(self):
-        """Initialize the model handler."""
-        self.models = {
-            ModelType.CHATGPT: {"initialized": False, "api_key": None},
-            ModelType.GEMMA: {"initialized": False, "api_key": None, "local_path": None},
-            ModelType.QISKIT: {"initialized": False, "api_key": None}
+
+    def __init__(self, config_path: Optional[str] = None):
+        """
+        Initialize the model handler.
+
+        Args:
+            config_path (str, optional): Path to the model config JSON file
+        """
+        # One preallocated slot per model, indexed by ModelType.index;
+        # attribute loads here are cheaper than nested dict probes on
+        # the per-call is_initialized checks
+        # Slots are immutable and replaced wholesale, so a single list
+        # item assignment publishes new state atomically under the GIL
+        # and readers on other threads never need a lock
+        self._slots = [ModelSlot() for _ in ModelType]
+
+        # Last reported status per model, mutated in place on transitions
+        self._status = [_ModelStatus() for _ in ModelType]
+
+        if config_path is None:
+            config_path = os.path.join(
+                os.path.dirname(os.path.abspath(__file__)),
+                '..', '..', 'data', 'model_config.json'
+            )
+        self.config_path = config_path
+        self._cache_path = config_path + '.cache.pkl'
+
+        # Ensure the config directory exists
+        os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
+
+        # Load saved API keys and model paths. In memory these are keyed
+        # by ModelType directly — one canonical hash per member — so the
+        # hot get/set paths skip the .value lookup and string hashing;
+        # translation to string keys happens only at the I/O boundary
+        self.api_keys: Dict[ModelType, str] = {}
+        self.model_paths: Dict[ModelType, str] = {}
+        self.last_used_model: Optional[str] = None
+        self._apply_raw(self._load_config())
+
+        # Pending-write state for debounced config saves; the lock
+        # serializes writes queued on the worker pool
+        self._dirty = False
+        self._flush_scheduled = False
+        self._io_lock = threading.Lock()
+
+        # Shared worker pool for model I/O; reusing warmed threads avoids
+        # a pthread_create + Thread object per request and gives callers
+        # cancellation via the returned Future
+        self._executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix='elai-model'
+        )
+
+        # Observers notified when a model's status changes; a set keeps
+        # subscribe/unsubscribe O(1) as screens register on enter/leave.
+        # Entries are weak references so a registered Screen (and its
+        # widget tree) can still be garbage collected
+        self.status_callbacks: set = set()
+
+    @staticmethod
+    def _weak_callback(callback):
+        """Wrap a callback in the appropriate weak reference type."""
+        if inspect.ismethod(callback):
+            return weakref.WeakMethod(callback)
+        return weakref.ref(callback)
+
+    def register_status_callback(self, callback) -> None:
+        """
+        Register a callback invoked as callback(model_type, status, error)
+        whenever a model's status changes. Only a weak reference is kept,
+        so registering does not keep the owner alive.
+
+        Args:
+            callback: Callable taking (ModelType, str, Optional[str])
+        """
+        self.status_callbacks.add(self._weak_callback(callback))
+
+    def unregister_status_callback(self, callback) -> None:
+        """
+        Unregister a previously registered status callback.
+
+        Args:
+            callback: The callback to remove (missing entries are ignored)
+        """
+        self.status_callbacks.discard(self._weak_callback(callback))
+
+    def _set_status(self, model_type: ModelType, status: str,
+                    error: Optional[str] = None) -> None:
+        """
+        Notify registered callbacks of a model status change.
+
+        Args:
+            model_type (ModelType): The model whose status changed
+            status (str): New status ('initialized', 'error', ...)
+            error (str, optional): Error message when status is 'error'
+        """
+        record = self._status[model_type.index]
+        record.status = status
+        record.error = error
+
+        # Iterate a snapshot so callbacks may unregister during notify;
+        # dead references are pruned opportunistically as we go
+        for ref in list(self.status_callbacks):
+            callback = ref()
+            if callback is None:
+                self.status_callbacks.discard(ref)
+                continue
+            try:
+                callback(model_type, status, error)
+            except Exception:
+                # exception() defers traceback formatting to the handler,
+                # so it costs nothing when the record is filtered out
+                Logger.exception("ModelHandler: Status callback failed")
+
+    def _apply_raw(self, raw: Dict[str, Any]) -> None:
+        """
+        Populate the in-memory config from an on-disk (string-keyed) dict.
+
+        Args:
+            raw (Dict): Parsed config with string model names as keys
+        """
+        self.api_keys = {
+            mt: v for k, v in raw.get('api_keys', {}).items()
+            if (mt := ModelType.from_string(k)) is not None
         }
-        
-        # Threading lock for model initialization
-        self.lock = threading.Lock()
-    
+        self.model_paths = {
+            mt: v for k, v in raw.get('model_paths', {}).items()
+            if (mt := ModelType.from_string(k)) is not None
+        }
+        self.last_used_model = raw.get('last_used_model')
+
+    def _to_raw(self) -> Dict[str, Any]:
+        """
+        Build the on-disk (string-keyed) form of the in-memory config.
+
+        Returns:
+            Dict: JSON-serializable config dict
+        """
+        return {
+            'api_keys': {k.value: v for k, v in self.api_keys.items()},
+            'model_paths': {k.value: v for k, v in self.model_paths.items()},
+            'last_used_model': self.last_used_model,
+        }
+
+    def _load_config(self) -> Dict[str, Dict[str, str]]:
+        """
+        Load saved API keys and model paths.
+
+        Prefers the pickle cache (last-known-good, microseconds to read)
+        and reconciles against the JSON source of truth on the next
+        frame, so a slow disk or a corrupted JSON file never blocks
+        startup or wipes settings.
+
+        Returns:
+            Dict[str, Dict[str, str]]: The loaded config, or an empty one
+        """
+        try:
+            if os.path.exists(self._cache_path):
+                with open(self._cache_path, 'rb') as f:
+                    config = pickle.loads(f.read())
+                Clock.schedule_once(lambda dt: self._reconcile_config(), 0)
+                return config
+        except Exception as e:
+            Logger.error("ModelHandler: Failed to load config cache: %s", e)
+
+        return self._load_config_json()
+
+    def _load_config_json(self) -> Dict[str, Dict[str, str]]:
+        """
+        Load the config from the JSON file.
+
+        Returns:
+            Dict[str, Dict[str, str]]: The parsed config, or an empty one
+        """
+        try:
+            if os.path.exists(self.config_path):
+                # Slurp the whole file in one read and parse from memory;
+                # incremental reads cost a syscall per chunk
+                with open(self.config_path, 'rb') as f:
+                    config = json.loads(f.read())
+                config.setdefault('api_keys', {})
+                config.setdefault('model_paths', {})
+                return config
+        except Exception as e:
+            Logger.error("ModelHandler: Failed to load config: %s", e)
+
+        return {'api_keys': {}, 'model_paths': {}}
+
+    def _reconcile_config(self) -> None:
+        """
+        Validate the cache-served config against the JSON source of truth.
+
+        Runs asynchronously after a cache-backed startup. If the JSON
+        parses and differs, it wins; if it is corrupt or unreadable, the
+        stale cache state is kept rather than falling back to empty dicts.
+        """
+        if self._dirty:
+            # In-session changes take precedence over whatever is on disk
+            return
+        try:
+            if os.path.exists(self.config_path):
+                fresh = self._load_config_json()
+                if fresh != self._to_raw():
+                    self._apply_raw(fresh)
+        except Exception as e:
+            Logger.error("ModelHandler: Config reconcile failed, "
+                         "keeping cached state: %s", e)
+
+    def _save_config(self) -> bool:
+        """
+        Queue the config write on the worker pool.
+
+        Settings handlers run on the UI thread; a synchronous write on
+        slow storage can stall frames, so the disk I/O happens on a
+        worker and failures are reported through the log.
+
+        Returns:
+            bool: True (the write was queued)
+        """
+        self._executor.submit(self._save_config_sync)
+        return True
+
+    def _save_config_sync(self) -> bool:
+        """
+        Save the API keys and model paths to the config file.
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            # Serialize concurrent saves so the latest write wins whole
+            with self._io_lock:
+                # Translate enum keys to strings once at the I/O boundary,
+                # then serialize to memory so the file is written with a
+                # single call instead of many small dump() writes
+                raw = self._to_raw()
+                payload = json.dumps(raw, indent=2).encode('utf-8')
+                with open(self.config_path, 'wb') as f:
+                    f.write(payload)
+                # Mirror to the pickle cache used for fast stale-while-
+                # revalidate startup loads
+                try:
+                    with open(self._cache_path, 'wb') as f:
+                        f.write(pickle.dumps(raw))
+                except Exception as e:
+                    Logger.error("ModelHandler: Failed to write config cache: %s", e)
+            return True
+        except Exception as e:
+            Logger.error("ModelHandler: Failed to save config: %s", e)
+            return False
+
+    def warm_last_used(self) -> None:
+        """
+        Initialize the model the user selected last, in the background.
+
+        The first Generate after startup almost always targets the same
+        model as the previous session, so warming it here means the
+        client handshake has already happened by the time it is needed.
+        """
+        last = self.last_used_model
+        model_type = ModelType.from_string(last) if last else None
+        if model_type is None or self.is_initialized(model_type):
+            return
+
+        api_key = self.get_api_key(model_type)
+        path = self.get_model_path(model_type)
+
+        if model_type == ModelType.CHATGPT and api_key:
+            self.submit(self.initialize_openai, api_key)
+        elif model_type == ModelType.GEMMA and (api_key or path):
+            self.submit(self.initialize_gemma,
+                        api_key or None, path or None)
+        elif model_type == ModelType.QISKIT and api_key:
+            self.submit(self.initialize_qiskit, api_key)
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """
+        Run a blocking model job on the shared worker pool.
+
+        Args:
+            fn: Callable to execute off the UI thread
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future: Handle for the queued job (supports cancel/result)
+        """
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def shutdown(self) -> None:
+        """Flush pending config changes and stop the worker pool."""
+        # The process is exiting, so write synchronously rather than
+        # queueing on a pool that is about to be cancelled
+        self._flush_scheduled = False
+        if self._dirty:
+            self._dirty = False
+            self._save_config_sync()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _mark_dirty(self) -> None:
+        """Flag the config as modified and schedule a coalesced save."""
+        self._dirty = True
+        if not self._flush_scheduled:
+            # A burst of setter calls (e.g. saving several keys from the
+            # settings screen) produces one serialization+write instead
+            # of a full-file rewrite per call
+            self._flush_scheduled = True
+            Clock.schedule_once(lambda dt: self._flush_config(), 0.25)
+
+    def _flush_config(self) -> bool:
+        """
+        Write the config to disk if there are pending changes.
+
+        Returns:
+            bool: True if nothing was pending or the save succeeded
+        """
+        self._flush_scheduled = False
+        if not self._dirty:
+            return True
+        self._dirty = False
+        return self._save_config()
+
+    def get_api_key(self, model_type: ModelType) -> str:
+        """
+        Get the saved API key for a model.
+
+        Args:
+            model_type (ModelType): The model type to look up
+
+        Returns:
+            str: The saved API key, or '' if none is stored
+        """
+        return self.api_keys.get(model_type, '')
+
+    def set_api_key(self, model_type: ModelType, api_key: str) -> bool:
+        """
+        Save the API key for a model.
+
+        Args:
+            model_type (ModelType): The model type to update
+            api_key (str): The API key to store
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        self.api_keys[model_type] = api_key
+        self._mark_dirty()
+        return True
+
+    def set_api_keys(self, mapping: Dict[ModelType, str]) -> bool:
+        """
+        Save several API keys with one coalesced config write.
+
+        Args:
+            mapping (Dict[ModelType, str]): API keys keyed by model type
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not mapping:
+            return True
+        self.api_keys.update(mapping)
+        self._mark_dirty()
+        return True
+
+    def get_model_path(self, model_type: ModelType) -> str:
+        """
+        Get the saved local model path for a model.
+
+        Args:
+            model_type (ModelType): The model type to look up
+
+        Returns:
+            str: The saved path, or '' if none is stored
+        """
+        return self.model_paths.get(model_type, '')
+
+    def set_model_path(self, model_type: ModelType, path: str) -> bool:
+        """
+        Save the local model path for a model.
+
+        Args:
+            model_type (ModelType): The model type to update
+            path (str): The path to store
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        self.model_paths[model_type] = path
+        self._mark_dirty()
+        return True
+
+
     def initialize_openai(self, api_key: str) -> bool:
         """
         Initialize the OpenAI API.
@@ -46,35 +502,25 @@ class ModelHandler:
         """
         try:
             # Import openai here to prevent immediate dependency requirement
-            import openai
             from openai import OpenAI
-            
+
             # Set API key
             client = OpenAI(api_key=api_key)
-            
-            # Test API connection
-            response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": "Hello, are you working?"}],
-                max_tokens=10
+
+            # Creating the client is purely local; the key is verified
+            # lazily on the first real request instead of paying a
+            # network round-trip here (which would block the caller)
+            self._slots[ModelType.CHATGPT.index] = ModelSlot(
+                initialized=True,
+                api_key=api_key,
+                client=client
             )
-            
-            # Check if response is valid
-            if response and hasattr(response, 'choices') and len(response.choices) > 0:
-                # Store API key and client
-                with self.lock:
-                    self.models[ModelType.CHATGPT] = {
-                        "initialized": True,
-                        "api_key": api_key,
-                        "client": client
-                    }
-                return True
-            else:
-                Logger.error("ModelHandler: OpenAI API initialization failed - invalid response")
-                return False
-                
+            self._set_status(ModelType.CHATGPT, 'initialized')
+            return True
+
         except Exception as e:
-            Logger.error(f"ModelHandler: OpenAI API initialization failed: {e}")
+            Logger.error("ModelHandler: OpenAI API initialization failed: %s", e)
+            self._set_status(ModelType.CHATGPT, 'error', str(e))
             return False
     
     def initialize_gemma(self, api_key: Optional[str] = None, local_path: Optional[str] = None) -> bool:
@@ -95,33 +541,34 @@ class ModelHandler:
             
             if local_path:
                 # Try to initialize local Gemma model
-                # This is a placeholder - in a real app, you'd use the actual Gemma SDK
+                # This is a placeholder - in a real app, you'd use the actual Gemma SDK,
+                # imported here (not at module scope) so unused backends never
+                # charge their import time to startup
                 if os.path.exists(local_path):
-                    with self.lock:
-                        self.models[ModelType.GEMMA] = {
-                            "initialized": True,
-                            "api_key": None,
-                            "local_path": local_path,
-                            "mode": "local"
-                        }
+                    self._slots[ModelType.GEMMA.index] = ModelSlot(
+                        initialized=True,
+                        local_path=local_path,
+                        mode="local"
+                    )
+                    self._set_status(ModelType.GEMMA, 'initialized')
                     return True
                 else:
-                    Logger.error(f"ModelHandler: Local Gemma model not found at {local_path}")
+                    Logger.error("ModelHandler: Local Gemma model not found at %s", local_path)
                     return False
             else:
                 # Initialize cloud Gemma API
                 # This is a placeholder - in a real app, you'd use the actual Gemma API
-                with self.lock:
-                    self.models[ModelType.GEMMA] = {
-                        "initialized": True,
-                        "api_key": api_key,
-                        "local_path": None,
-                        "mode": "cloud"
-                    }
+                self._slots[ModelType.GEMMA.index] = ModelSlot(
+                    initialized=True,
+                    api_key=api_key,
+                    mode="cloud"
+                )
+                self._set_status(ModelType.GEMMA, 'initialized')
                 return True
-                
+
         except Exception as e:
-            Logger.error(f"ModelHandler: Gemma initialization failed: {e}")
+            Logger.error("ModelHandler: Gemma initialization failed: %s", e)
+            self._set_status(ModelType.GEMMA, 'error', str(e))
             return False
     
     def initialize_qiskit(self, api_key: str) -> bool:
@@ -136,18 +583,20 @@ class ModelHandler:
         """
         try:
             # This is a placeholder - in a real app, you'd use the actual Qiskit SDK
-            # Import qiskit here to prevent immediate dependency requirement
+            # Import qiskit here (not at module scope) to prevent immediate
+            # dependency requirement and keep its import cost off startup
             # import qiskit
             
-            with self.lock:
-                self.models[ModelType.QISKIT] = {
-                    "initialized": True,
-                    "api_key": api_key
-                }
+            self._slots[ModelType.QISKIT.index] = ModelSlot(
+                initialized=True,
+                api_key=api_key
+            )
+            self._set_status(ModelType.QISKIT, 'initialized')
             return True
-                
+
         except Exception as e:
-            Logger.error(f"ModelHandler: Qiskit initialization failed: {e}")
+            Logger.error("ModelHandler: Qiskit initialization failed: %s", e)
+            self._set_status(ModelType.QISKIT, 'error', str(e))
             return False
     
     def is_initialized(self, model_type: ModelType) -> bool:
@@ -160,7 +609,7 @@ class ModelHandler:
         Returns:
             bool: True if initialized, False otherwise
         """
-        return self.models.get(model_type, {}).get("initialized", False)
+        return self._slots[model_type.index].initialized
     
     def get_initialized_models(self) -> List[ModelType]:
         """
@@ -169,16 +618,20 @@ class ModelHandler:
         Returns:
             List[ModelType]: List of initialized model types
         """
-        return [model_type for model_type in self.models if self.is_initialized(model_type)]
+        return [model_type for model_type in ModelType
+                if self._slots[model_type.index].initialized]
     
-    def generate_text(self, model_type: ModelType, prompt: str) -> Dict[str, Any]:
+    def generate_text(self, model_type: ModelType, prompt: str,
+                      on_token: Optional[Callable[[Optional[str]], None]] = None) -> Dict[str, Any]:
         """
         Generate text using a specific model.
-        
+
         Args:
             model_type (ModelType): The model to use
             prompt (str): Text prompt to send to the model
-            
+            on_token (callable, optional): Sink called with text chunks as
+                they arrive and finally with None to signal end-of-stream
+
         Returns:
             Dict[str, Any]: Results dict with 'success', 'text', and optional 'error'
         """
@@ -187,38 +640,61 @@ class ModelHandler:
                 "success": False,
                 "error": f"Model {model_type.value} is not initialized"
             }
-        
+
+        # Remember the selection so the next startup can pre-warm it
+        if self.last_used_model != model_type.value:
+            self.last_used_model = model_type.value
+            self._mark_dirty()
+
+
         try:
             if model_type == ModelType.CHATGPT:
-                return self._generate_chatgpt(prompt)
+                return self._generate_chatgpt(prompt, on_token)
             elif model_type == ModelType.GEMMA:
-                return self._generate_gemma(prompt)
+                return self._generate_gemma(prompt, on_token)
             else:
                 return {
                     "success": False,
                     "error": f"Text generation not supported for {model_type.value}"
                 }
         except Exception as e:
-            Logger.error(f"ModelHandler: Text generation failed: {e}")
+            Logger.error("ModelHandler: Text generation failed: %s", e)
             return {
                 "success": False,
                 "error": str(e)
             }
     
-    def _generate_chatgpt(self, prompt: str) -> Dict[str, Any]:
+    @staticmethod
+    def _emit_placeholder_stream(text: str, on_token) -> None:
+        """
+        Feed placeholder output to a token sink word by word on the Clock.
+
+        Args:
+            text (str): The full placeholder response
+            on_token (callable): Sink for chunks, None signals completion
+        """
+        words = text.split(' ')
+        last = len(words) - 1
+        for i, word in enumerate(words):
+            chunk = word if i == last else word + ' '
+            Clock.schedule_once(lambda dt, c=chunk: on_token(c), i * 0.01)
+        Clock.schedule_once(lambda dt: on_token(None), len(words) * 0.01)
+
+    def _generate_chatgpt(self, prompt: str,
+                          on_token=None) -> Dict[str, Any]:
         """
         Generate text using OpenAI's ChatGPT.
-        
+
         Args:
             prompt (str): Text prompt to send to the model
-            
+            on_token (callable, optional): Sink for incremental text chunks
+
         Returns:
             Dict[str, Any]: Results dict with 'success', 'text', and optional 'error'
         """
         try:
-            model_info = self.models[ModelType.CHATGPT]
-            client = model_info.get("client")
-            
+            client = self._slots[ModelType.CHATGPT.index].client
+
             if not client:
                 return {"success": False, "error": "OpenAI client not initialized"}
             
@@ -232,6 +708,11 @@ class ModelHandler:
             # Extract the generated text
             if response and hasattr(response, 'choices') and len(response.choices) > 0:
                 generated_text = response.choices[0].message.content
+                if on_token is not None:
+                    # Non-streaming API call today; route the text through
+                    # the sink anyway so callers have one incremental path
+                    on_token(generated_text)
+                    on_token(None)
                 return {
                     "success": True,
                     "text": generated_text
@@ -243,33 +724,44 @@ class ModelHandler:
                 }
                 
         except Exception as e:
-            Logger.error(f"ModelHandler: ChatGPT generation failed: {e}")
+            Logger.error("ModelHandler: ChatGPT generation failed: %s", e)
+
+            # The key is verified lazily; an auth failure here means the
+            # stored key is bad, so downgrade the model to uninitialized
+            if getattr(e, "status_code", None) == 401:
+                self._slots[ModelType.CHATGPT.index] = ModelSlot()
+                self._set_status(ModelType.CHATGPT, 'error', str(e))
+
             return {
                 "success": False,
                 "error": str(e)
             }
-    
-    def _generate_gemma(self, prompt: str) -> Dict[str, Any]:
+
+    def _generate_gemma(self, prompt: str,
+                        on_token=None) -> Dict[str, Any]:
         """
         Generate text using Gemma.
-        
+
         Args:
             prompt (str): Text prompt to send to the model
-            
+            on_token (callable, optional): Sink for incremental text chunks
+
         Returns:
             Dict[str, Any]: Results dict with 'success', 'text', and optional 'error'
         """
         try:
-            model_info = self.models[ModelType.GEMMA]
-            mode = model_info.get("mode")
+            slot = self._slots[ModelType.GEMMA.index]
+            mode = slot.mode
             
             if mode == "local":
                 # This is a placeholder for local Gemma model inference
                 # In a real app, you'd use the actual Gemma local inference
-                local_path = model_info.get("local_path")
+                local_path = slot.local_path
                 
                 # Simulate generation with a placeholder
                 generated_text = f"[Local Gemma model response to: {prompt[:50]}...]"
+                if on_token is not None:
+                    self._emit_placeholder_stream(generated_text, on_token)
                 return {
                     "success": True,
                     "text": generated_text
@@ -278,10 +770,12 @@ class ModelHandler:
             elif mode == "cloud":
                 # This is a placeholder for cloud Gemma API
                 # In a real app, you'd use the actual Gemma cloud API
-                api_key = model_info.get("api_key")
+                api_key = slot.api_key
                 
                 # Simulate generation with a placeholder
                 generated_text = f"[Cloud Gemma API response to: {prompt[:50]}...]"
+                if on_token is not None:
+                    self._emit_placeholder_stream(generated_text, on_token)
                 return {
                     "success": True,
                     "text": generated_text
@@ -294,7 +788,7 @@ class ModelHandler:
                 }
                 
         except Exception as e:
-            Logger.error(f"ModelHandler: Gemma generation failed: {e}")
+            Logger.error("ModelHandler: Gemma generation failed: %s", e)
             return {
                 "success": False,
                 "error": str(e)
@@ -310,17 +804,21 @@ class ModelHandler:
         Returns:
             Dict[str, Any]: Model status information
         """
-        model_info = self.models.get(model_type, {})
-        
-        # Copy the dict to avoid exposing internal state
-        status = model_info.copy()
-        
-        # Remove sensitive information
-        if "api_key" in status:
-            status["api_key"] = "***" if status["api_key"] else None
-        
-        # Remove internal objects
-        if "client" in status:
-            status["client"] = "initialized" if status["client"] else None
-            
-        return status
\ No newline at end of file
+        if model_type is None:
+            return _INVALID_STATUS
+
+        slot = self._slots[model_type.index]
+        record = self._status[model_type.index]
+
+        # Report a plain dict so internal state is not exposed, masking
+        # the API key and the client object; dicts are built only at
+        # this API boundary, not on every status transition
+        return {
+            "initialized": slot.initialized,
+            "status": record.status,
+            "error": record.error,
+            "api_key": "***" if slot.api_key else None,
+            "client": "initialized" if slot.client else None,
+            "local_path": slot.local_path,
+            "mode": slot.mode
+        }
\ No newline at end of file
@@ -0,0 +1,51 @@
+"""
+Shared Screen Building Blocks.
+Compiled KV rules reused by several screens.
+"""
+
+from kivy.factory import Factory
+from kivy.lang import Builder
+
+# Back-button + title header most screens open with; compiled once and
+# stamped per screen instead of hand-building the same three widgets
+# (and a fresh back-press closure) in every create_content
+Builder.load_string('''
+<ScreenHeader@BoxLayout>:
+    title: ''
+    size_hint: 1, 0.1
+    spacing: dp(10)
+    Button:
+        text: 'Back'
+        size_hint: 0.2, 1
+        background_normal: ''
+        background_color: 0.3, 0.3, 0.3, 1
+        on_press: app.navigate_to('home')
+    Label:
+        text: root.title
+        font_size: dp(24)
+        bold: True
+        size_hint: 0.8, 1
+
+<ResultLine@Label>:
+    halign: 'left'
+    valign: 'middle'
+    text_size: self.width, None
+    size_hint_y: None
+    height: dp(20)
+
+<ResultsView@RecycleView>:
+    viewclass: 'ResultLine'
+    RecycleBoxLayout:
+        orientation: 'vertical'
+        default_size: None, dp(20)
+        default_size_hint: 1, None
+        size_hint_y: None
+        height: self.minimum_height
+''')
+
+ScreenHeader = Factory.ScreenHeader
+
+# Virtualized multi-line output: only the visible ResultLine rows are
+# instantiated, so populating thousands of lines stays O(visible)
+# where a readonly TextInput re-lays out the whole buffer
+ResultsView = Factory.ResultsView
@@ -12,13 +12,36 @@ from kivy.uix.image import Image
 from kivy.metrics import dp
 from kivy.core.window import Window
 
+from kivy_app.utils.ui import COLOR_GRAY
+
+
+# Metric conversions computed once at import; dp() re-runs the DPI
+# multiply on every call, which adds up across a screen build
+DP_10 = dp(10)
+DP_15 = dp(15)
+DP_18 = dp(18)
+DP_20 = dp(20)
+DP_24 = dp(24)
+DP_40 = dp(40)
+DP_50 = dp(50)
+DP_60 = dp(60)
+DP_100 = dp(100)
+DP_120 = dp(120)
+DP_150 = dp(150)
+
 class AboutScreen(Screen):
     """Screen with information about the app."""
-    
+
+    # Cached running-app reference, filled on first enter; repeating
+    # App.get_running_app() in every handler is several attribute loads
+    # plus a call per press
+    app = None
+
     def on_enter(self, *args):
         """Actions to perform when screen is entered."""
-        app = App.get_running_app()
-        
+        if self.app is None:
+            self.app = App.get_running_app()
+
         # Create content if not already created
         if not self.children:
             self.create_content()
@@ -26,24 +49,26 @@ class AboutScreen(Screen):
     def create_content(self):
         """Create the screen content."""
         # Main layout
-        layout = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(15))
+        layout = BoxLayout(orientation='vertical', padding=DP_20, spacing=DP_15)
         
         # Header
-        header = BoxLayout(size_hint=(1, 0.1), spacing=dp(10))
+        header = BoxLayout(size_hint=(1, 0.1), spacing=DP_10)
         back_button = Button(
             text='Back',
             size_hint=(0.2, 1),
             background_normal='',
-            background_color=(0.3, 0.3, 0.3, 1)
+            background_color=COLOR_GRAY
         )
         title_label = Label(
             text='About',
-            font_size=dp(24),
+            font_size=DP_24,
             bold=True,
             size_hint=(0.8, 1)
         )
         
-        back_button.bind(on_press=lambda x: self._go_back())
+        # Bind the bound method directly; a lambda would allocate a
+        # closure per build and add a Python frame to every press
+        back_button.bind(on_press=self._go_back)
         
         header.add_widget(back_button)
         header.add_widget(title_label)
@@ -52,33 +77,32 @@ class AboutScreen(Screen):
         content = BoxLayout(
             orientation='vertical',
             size_hint=(1, 0.9),
-            spacing=dp(20)
+            spacing=DP_20
         )
         content.bind(minimum_height=content.setter('height'))
         
         # App logo
         logo_wrapper = BoxLayout(
             size_hint=(1, None),
-            height=dp(100),
-            padding=[dp(50), 0]
+            height=DP_100,
+            padding=[DP_50, 0]
         )
         logo = Image(
             source='resources/app_icon.png',
             allow_stretch=True,
             size_hint=(None, None),
-            size=(dp(100), dp(100))
+            size=(DP_100, DP_100)
         )
         logo_wrapper.add_widget(logo)
         
         # App name and version
-        app = App.get_running_app()
         app_info = Label(
-            text=f'El AI Assistant\nVersion {app.version}',
-            font_size=dp(20),
+            text=f'El AI Assistant\nVersion {self.app.version}',
+            font_size=DP_20,
             halign='center',
             valign='middle',
             size_hint=(1, None),
-            height=dp(60)
+            height=DP_60
         )
         
         # Description
@@ -88,8 +112,8 @@ class AboutScreen(Screen):
                  'The app integrates multiple AI models and provides a '
                  'comprehensive suite of features for developers and researchers.',
             size_hint=(1, None),
-            height=dp(120),
-            text_size=(Window.width - dp(40), None),
+            height=DP_120,
+            text_size=(Window.width - DP_40, None),
             halign='left',
             valign='top'
         )
@@ -98,10 +122,10 @@ class AboutScreen(Screen):
         # Features
         features_title = Label(
             text='Key Features:',
-            font_size=dp(18),
+            font_size=DP_18,
             bold=True,
             size_hint=(1, None),
-            height=dp(40),
+            height=DP_40,
             halign='left'
         )
         
@@ -113,10 +137,10 @@ class AboutScreen(Screen):
                  '• Model Training\n'
                  '• Data Comparison',
             size_hint=(1, None),
-            height=dp(150),
+            height=DP_150,
             halign='left',
             valign='top',
-            text_size=(Window.width - dp(40), None)
+            text_size=(Window.width - DP_40, None)
         )
         features_list.bind(texture_size=features_list.setter('size'))
         
@@ -125,7 +149,7 @@ class AboutScreen(Screen):
             text='© 2023-2024 El AI Assistant Team\n'
                  'All rights reserved.',
             size_hint=(1, None),
-            height=dp(50),
+            height=DP_50,
             halign='center',
             valign='bottom'
         )
@@ -145,7 +169,13 @@ class AboutScreen(Screen):
         # Add to screen
         self.add_widget(layout)
     
-    def _go_back(self):
+    def on_leave(self, *args):
+        """Actions to perform when leaving the screen."""
+        # This screen is static and rarely revisited, so drop its widget
+        # tree (and the GL textures it holds) instead of keeping it
+        # materialized for the life of the app; on_enter rebuilds it
+        self.clear_widgets()
+
+    def _go_back(self, *args):
         """Return to the home screen."""
-        app = App.get_running_app()
-        app.navigate_to('home')
\ No newline at end of file
+        self.app.navigate_to('home')
\ No newline at end of file
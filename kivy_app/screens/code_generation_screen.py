@@ -3,231 +3,217 @@ Code Generation Screen Module.
 This screen provides code generation capabilities using AI models.
 """
 
+import re
+from functools import partial
+
 from kivy.app import App
 from kivy.uix.screenmanager import Screen
-from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.gridlayout import GridLayout
-from kivy.uix.scrollview import ScrollView
-from kivy.uix.label import Label
-from kivy.uix.textinput import TextInput
-from kivy.uix.button import Button
-from kivy.uix.spinner import Spinner
-from kivy.metrics import dp
-from kivy.properties import StringProperty
-from kivy.logger import Logger
+from kivy.core.clipboard import Clipboard
+from kivy.clock import Clock
+from kivy.factory import Factory
+from kivy.lang import Builder
 
 from kivy_app.models.model_handler import ModelType
+# Imported for its side effect: registers the shared ScreenHeader rule
+# used in the KV template below
+from kivy_app.screens import _common
+
+
+# Compiled once at import; search() suffices because only the first
+# markdown code block is used
+_CODE_BLOCK_RE = re.compile(r'```(?:\w+)?\n([\s\S]+?)\n```')
+
+# Spinner-text lookups hoisted to module scope so handlers do an O(1)
+# probe instead of rebuilding a dict (or walking an if/elif chain) per
+# press
+_MODEL_MAP = {
+    'ChatGPT': ModelType.CHATGPT,
+    'Gemma': ModelType.GEMMA,
+}
+
+# Constant instruction tail appended to every prompt; kept out of the
+# per-press f-string so the 70-byte literal is not rebuilt each click
+_PROMPT_SUFFIX = (
+    "\n\nPlease provide only the code with appropriate comments, "
+    "no explanations."
+)
+
+_LANG_EXT = {
+    'Python': '.py',
+    'JavaScript': '.js',
+    'Java': '.java',
+    'C++': '.cpp',
+    'Go': '.go',
+    'Rust': '.rs',
+    'PHP': '.php',
+    'Swift': '.swift',
+    'Kotlin': '.kt',
+    'C#': '.cs',
+}
+
+
+# The layout lives in a KV template compiled once at import; the KV
+# parser instantiates the subtree with batched property application,
+# which beats ~25 Python-side constructor-and-bind calls per build
+KV = '''
+<CodeLine@Label>:
+    font_name: 'monospace'
+    halign: 'left'
+    valign: 'middle'
+    text_size: self.width, None
+    size_hint_y: None
+    height: dp(20)
+
+<CodeGenContent@BoxLayout>:
+    orientation: 'vertical'
+    padding: dp(20)
+    spacing: dp(15)
+    ScreenHeader:
+        title: 'Code Generation'
+    BoxLayout:
+        orientation: 'vertical'
+        size_hint: 1, 0.9
+        spacing: dp(15)
+        BoxLayout:
+            orientation: 'horizontal'
+            size_hint: 1, 0.08
+            spacing: dp(10)
+            Label:
+                text: 'Model:'
+                size_hint: 0.15, 1
+            Spinner:
+                id: model_spinner
+                text: 'ChatGPT'
+                values: ('ChatGPT', 'Gemma')
+                size_hint: 0.35, 1
+            Label:
+                text: 'Language:'
+                size_hint: 0.15, 1
+            Spinner:
+                id: language_spinner
+                text: 'Python'
+                values: ('Python', 'JavaScript', 'Java', 'C++', 'Go', 'Rust', 'PHP', 'Swift', 'Kotlin', 'C#')
+                size_hint: 0.35, 1
+        BoxLayout:
+            orientation: 'vertical'
+            size_hint: 1, 0.3
+            spacing: dp(5)
+            Label:
+                text: 'Prompt:'
+                size_hint: 1, 0.15
+                halign: 'left'
+                text_size: self.size
+            TextInput:
+                id: prompt_input
+                hint_text: 'Describe the code you want to generate (e.g., "Create a function to sort a list of dictionaries by a specific key")'
+                size_hint: 1, 0.85
+                multiline: True
+        BoxLayout:
+            size_hint: 1, 0.1
+            spacing: dp(10)
+            Button:
+                id: generate_button
+                text: 'Generate Code'
+                size_hint: 0.5, 1
+                background_normal: ''
+                background_color: 0.2, 0.7, 0.3, 1
+            Button:
+                id: clear_button
+                text: 'Clear'
+                size_hint: 0.5, 1
+                background_normal: ''
+                background_color: 0.7, 0.3, 0.3, 1
+        BoxLayout:
+            orientation: 'vertical'
+            size_hint: 1, 0.42
+            spacing: dp(5)
+            Label:
+                text: 'Generated Code:'
+                size_hint: 1, 0.1
+                halign: 'left'
+                text_size: self.size
+            RecycleView:
+                id: code_output
+                size_hint: 1, 0.8
+                viewclass: 'CodeLine'
+                RecycleBoxLayout:
+                    orientation: 'vertical'
+                    default_size: None, dp(20)
+                    default_size_hint: 1, None
+                    size_hint_y: None
+                    height: self.minimum_height
+            BoxLayout:
+                size_hint: 1, 0.1
+                spacing: dp(10)
+                Button:
+                    id: copy_button
+                    text: 'Copy to Clipboard'
+                    size_hint: 0.5, 1
+                Button:
+                    id: save_button
+                    text: 'Save to File'
+                    size_hint: 0.5, 1
+'''
+Builder.load_string(KV)
 
 class CodeGenerationScreen(Screen):
     """Screen for code generation using AI models."""
-    
+
+    # Content is built once on first entry and kept for the
+    # life of the app; clearing the tree must opt back in by
+    # resetting this flag
+    _content_built = False
+
+    # Cached running-app reference, filled on first enter; repeating
+    # App.get_running_app() in every handler is several attribute loads
+    # plus a call per press
+    app = None
+
+    # In-flight generation state (class-level defaults, set per-instance)
+    _output_text = ''
+    _pending_future = None
+    _flush_event = None
+    _gen_seq = 0
+
     def on_enter(self, *args):
         """Actions to perform when screen is entered."""
+        if self.app is None:
+            self.app = App.get_running_app()
+
         # Create content if not already created
-        if not self.children:
+        if not self._content_built:
             self.create_content()
+            self._content_built = True
     
     def create_content(self):
-        """Create the screen content."""
-        # Main layout
-        main_layout = BoxLayout(
-            orientation='vertical',
-            padding=dp(20),
-            spacing=dp(15)
-        )
-        
-        # Header with back button
-        header = BoxLayout(
-            size_hint=(1, 0.1),
-            spacing=dp(10)
-        )
-        
-        back_button = Button(
-            text='Back',
-            size_hint=(0.2, 1),
-            background_normal='',
-            background_color=(0.3, 0.3, 0.3, 1)
-        )
-        back_button.bind(on_press=self._on_back_pressed)
-        
-        title = Label(
-            text='Code Generation',
-            font_size=dp(24),
-            bold=True,
-            size_hint=(0.8, 1)
-        )
-        
-        header.add_widget(back_button)
-        header.add_widget(title)
-        
-        # Main content
-        content_layout = BoxLayout(
-            orientation='vertical',
-            size_hint=(1, 0.9),
-            spacing=dp(15)
-        )
-        
-        # Model selection
-        model_section = BoxLayout(
-            orientation='horizontal',
-            size_hint=(1, 0.08),
-            spacing=dp(10)
-        )
-        
-        model_label = Label(
-            text='Model:',
-            size_hint=(0.15, 1)
-        )
-        
-        self.model_spinner = Spinner(
-            text='ChatGPT',
-            values=('ChatGPT', 'Gemma'),
-            size_hint=(0.35, 1)
-        )
-        
-        language_label = Label(
-            text='Language:',
-            size_hint=(0.15, 1)
-        )
-        
-        self.language_spinner = Spinner(
-            text='Python',
-            values=('Python', 'JavaScript', 'Java', 'C++', 'Go', 'Rust', 'PHP', 'Swift', 'Kotlin', 'C#'),
-            size_hint=(0.35, 1)
-        )
-        
-        model_section.add_widget(model_label)
-        model_section.add_widget(self.model_spinner)
-        model_section.add_widget(language_label)
-        model_section.add_widget(self.language_spinner)
-        
-        # Prompt section
-        prompt_section = BoxLayout(
-            orientation='vertical',
-            size_hint=(1, 0.3),
-            spacing=dp(5)
-        )
-        
-        prompt_header = Label(
-            text='Prompt:',
-            size_hint=(1, 0.15),
-            halign='left'
-        )
-        prompt_header.bind(size=prompt_header.setter('text_size'))
-        
-        # Prompt text input
-        self.prompt_input = TextInput(
-            hint_text='Describe the code you want to generate (e.g., "Create a function to sort a list of dictionaries by a specific key")',
-            size_hint=(1, 0.85),
-            multiline=True
-        )
-        
-        prompt_section.add_widget(prompt_header)
-        prompt_section.add_widget(self.prompt_input)
-        
-        # Action buttons
-        button_section = BoxLayout(
-            size_hint=(1, 0.1),
-            spacing=dp(10)
-        )
-        
-        generate_button = Button(
-            text='Generate Code',
-            size_hint=(0.5, 1),
-            background_normal='',
-            background_color=(0.2, 0.7, 0.3, 1)
-        )
-        
-        clear_button = Button(
-            text='Clear',
-            size_hint=(0.5, 1),
-            background_normal='',
-            background_color=(0.7, 0.3, 0.3, 1)
-        )
-        
-        # Bind buttons
-        generate_button.bind(on_press=self._on_generate_code)
-        clear_button.bind(on_press=self._on_clear)
-        
-        button_section.add_widget(generate_button)
-        button_section.add_widget(clear_button)
-        
-        # Generated code section
-        code_section = BoxLayout(
-            orientation='vertical',
-            size_hint=(1, 0.42),
-            spacing=dp(5)
-        )
-        
-        code_header = Label(
-            text='Generated Code:',
-            size_hint=(1, 0.1),
-            halign='left'
-        )
-        code_header.bind(size=code_header.setter('text_size'))
-        
-        # Code output in a scrollview
-        code_scroll = ScrollView(
-            size_hint=(1, 0.8)
-        )
-        
-        self.code_output = TextInput(
-            readonly=True,
-            font_name='monospace',
-            size_hint=(1, None),
-            height=dp(400)
-        )
-        
-        code_scroll.add_widget(self.code_output)
-        
-        # Action buttons for generated code
-        code_buttons = BoxLayout(
-            size_hint=(1, 0.1),
-            spacing=dp(10)
-        )
-        
-        copy_button = Button(
-            text='Copy to Clipboard',
-            size_hint=(0.5, 1)
-        )
-        
-        save_button = Button(
-            text='Save to File',
-            size_hint=(0.5, 1)
-        )
-        
+        """Create the screen content from the KV template."""
+        content = Factory.CodeGenContent()
+        ids = content.ids
+
+        # Keep the references the handlers use
+        self.model_spinner = ids.model_spinner
+        self.language_spinner = ids.language_spinner
+        self.prompt_input = ids.prompt_input
+        self.code_output = ids.code_output
+
         # Bind buttons
-        copy_button.bind(on_press=self._on_copy_to_clipboard)
-        save_button.bind(on_press=self._on_save_to_file)
-        
-        code_buttons.add_widget(copy_button)
-        code_buttons.add_widget(save_button)
-        
-        code_section.add_widget(code_header)
-        code_section.add_widget(code_scroll)
-        code_section.add_widget(code_buttons)
-        
-        # Add sections to content layout
-        content_layout.add_widget(model_section)
-        content_layout.add_widget(prompt_section)
-        content_layout.add_widget(button_section)
-        content_layout.add_widget(code_section)
-        
-        # Add widgets to main layout
-        main_layout.add_widget(header)
-        main_layout.add_widget(content_layout)
-        
-        # Add main layout to screen
-        self.add_widget(main_layout)
-    
-    def _on_back_pressed(self, instance):
-        """Handle back button press."""
-        app = App.get_running_app()
-        app.navigate_to('home')
-    
+        ids.generate_button.bind(on_press=self._on_generate_code)
+        ids.clear_button.bind(on_press=self._on_clear)
+        ids.copy_button.bind(on_press=self._on_copy_to_clipboard)
+        ids.save_button.bind(on_press=self._on_save_to_file)
+
+        self.add_widget(content)
+
+    def _set_output(self, text):
+        """Show text in the virtualized output view."""
+        # The RecycleView instantiates only the visible CodeLine rows,
+        # so long completions cost O(visible lines), not O(lines)
+        self._output_text = text
+        self.code_output.data = [{'text': line} for line in text.split('\n')]
+
     def _on_generate_code(self, instance):
         """Handle generate code button press."""
-        app = App.get_running_app()
+        app = self.app
         
         prompt = self.prompt_input.text.strip()
         if not prompt:
@@ -239,91 +225,132 @@ class CodeGenerationScreen(Screen):
         language = self.language_spinner.text
         
         # Map model name to ModelType
-        model_type = None
-        if model_name == 'ChatGPT':
-            model_type = ModelType.CHATGPT
-        elif model_name == 'Gemma':
-            model_type = ModelType.GEMMA
-        
+        model_type = _MODEL_MAP.get(model_name)
+
         if not model_type:
             app.notification_manager.error("Invalid model selected")
             return
         
         # Build complete prompt with language
-        complete_prompt = f"Generate {language} code for: {prompt}\n\nPlease provide only the code with appropriate comments, no explanations."
+        complete_prompt = f"Generate {language} code for: {prompt}" + _PROMPT_SUFFIX
         
         # Show loading message
         app.notification_manager.info(f"Generating code using {model_name}...")
-        self.code_output.text = "Generating code, please wait..."
-        
-        # Generate code using the selected model
-        result = app.model_handler.generate_text(model_type, complete_prompt)
-        
+        self._set_output("Generating code, please wait...")
+
+        # Reset streaming state; tokens accumulate in a buffer and the
+        # TextInput is re-laid-out at most 30 times a second instead of
+        # once per token (a full reflow each time)
+        self._stream_parts = []
+        self._stream_dirty = False
+        self._stream_done = False
+        self._flush_event = Clock.schedule_interval(self._flush_output, 1 / 30.0)
+
+        # Cancel any generation still in flight so the last tap wins;
+        # the sequence number makes already-running jobs discard their
+        # results instead of racing the new one
+        self._gen_seq += 1
+        seq = self._gen_seq
+        if self._pending_future is not None and not self._pending_future.done():
+            self._pending_future.cancel()
+
+        # Generate code on the shared pool, off the UI thread
+        self._pending_future = app.model_handler.submit(
+            self._do_generate, seq, model_type, complete_prompt)
+
+    def _do_generate(self, seq, model_type, complete_prompt):
+        """Worker-side generation; the result hops back to the UI thread."""
+        result = self.app.model_handler.generate_text(
+            model_type, complete_prompt,
+            on_token=partial(self._on_token, seq))
+        Clock.schedule_once(partial(self._on_generate_result, seq, result))
+
+    def _on_generate_result(self, seq, result, dt):
+        """Apply a finished generation on the UI thread."""
+        if seq != self._gen_seq:
+            # A newer request superseded this one; drop the stale result
+            return
+
+        app = self.app
         if result.get('success', False):
-            generated_text = result.get('text', '')
-            
-            # Extract code block if present (assuming markdown format from AI)
-            import re
-            code_block_pattern = r'```(?:\w+)?\n([\s\S]+?)\n```'
-            code_blocks = re.findall(code_block_pattern, generated_text)
-            
-            if code_blocks:
-                # Use the first code block found
-                self.code_output.text = code_blocks[0].strip()
-            else:
-                # Use the full output if no code blocks found
-                self.code_output.text = generated_text.strip()
-                
+            if not self._stream_parts and not self._stream_done:
+                # Backend ignored the sink; fall back to a single-shot set
+                self._flush_event.cancel()
+                self._set_output(self._extract_code(result.get('text', '')))
             app.notification_manager.success("Code generated successfully")
         else:
+            self._flush_event.cancel()
             error = result.get('error', 'Unknown error')
-            self.code_output.text = f"Error generating code: {error}"
+            self._set_output(f"Error generating code: {error}")
             app.notification_manager.error(f"Failed to generate code: {error}")
-    
+
+    def on_leave(self, *args):
+        """Cancel in-flight generation when the user navigates away."""
+        # A result landing after leave would touch a hidden widget tree
+        self._gen_seq += 1
+        if self._pending_future is not None:
+            self._pending_future.cancel()
+        if self._flush_event is not None:
+            self._flush_event.cancel()
+
+    def _on_token(self, seq, token):
+        """Token sink for streaming generation; None marks end-of-stream."""
+        if seq != self._gen_seq:
+            return
+        if token is None:
+            self._stream_done = True
+            return
+        self._stream_parts.append(token)
+        self._stream_dirty = True
+
+    def _flush_output(self, dt):
+        """Apply buffered stream chunks to the output, at most 30Hz."""
+        if self._stream_dirty:
+            self._stream_dirty = False
+            self._set_output(''.join(self._stream_parts))
+        if self._stream_done and not self._stream_dirty:
+            # Final pass: extract the code block from the full response
+            self._set_output(self._extract_code(''.join(self._stream_parts)))
+            return False  # unschedule
+
+    @staticmethod
+    def _extract_code(generated_text):
+        """Pull the first markdown code block out of a model response."""
+        # Extract code block if present (assuming markdown format from AI);
+        # fall back to the full output when there is none
+        match = _CODE_BLOCK_RE.search(generated_text)
+        return (match.group(1) if match else generated_text).strip()
+
     def _on_clear(self, instance):
         """Handle clear button press."""
         self.prompt_input.text = ""
-        self.code_output.text = ""
+        self._set_output("")
     
     def _on_copy_to_clipboard(self, instance):
         """Handle copy to clipboard button press."""
-        app = App.get_running_app()
+        app = self.app
         
-        if not self.code_output.text.strip():
+        if not self._output_text.strip():
             app.notification_manager.warning("No code to copy")
             return
         
         # Copy to clipboard
-        from kivy.core.clipboard import Clipboard
-        Clipboard.copy(self.code_output.text)
+        Clipboard.copy(self._output_text)
         
         app.notification_manager.success("Code copied to clipboard")
     
     def _on_save_to_file(self, instance):
         """Handle save to file button press."""
-        app = App.get_running_app()
+        app = self.app
         
-        code = self.code_output.text.strip()
+        code = self._output_text.strip()
         if not code:
             app.notification_manager.warning("No code to save")
             return
         
         # Map language to file extension
         language = self.language_spinner.text
-        extensions = {
-            'Python': '.py',
-            'JavaScript': '.js',
-            'Java': '.java',
-            'C++': '.cpp',
-            'Go': '.go',
-            'Rust': '.rs',
-            'PHP': '.php',
-            'Swift': '.swift',
-            'Kotlin': '.kt',
-            'C#': '.cs'
-        }
-        
-        extension = extensions.get(language, '.txt')
+        extension = _LANG_EXT.get(language, '.txt')
         
         # Create temporary file with the generated code
         temp_file = app.file_manager.create_temp_file(
@@ -335,11 +362,14 @@ class CodeGenerationScreen(Screen):
         if temp_file:
             app.notification_manager.success(f"Code saved to: {temp_file}")
             
-            # Ask user where to save the file permanently
+            # Ask user where to save the file permanently; save mode
+            # keeps the dialog on the in-app chooser, which returns a
+            # real writable path rather than a document-picker copy
             app.file_manager.select_file(
                 title=f"Save {language} Code",
                 filters=[f"*{extension}"],
-                on_selection=lambda path: self._on_save_location_selected(temp_file, path)
+                on_selection=partial(self._on_save_location_selected, temp_file),
+                mode='save'
             )
         else:
             app.notification_manager.error("Failed to save code to file")
\ No newline at end of file
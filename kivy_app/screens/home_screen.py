@@ -4,6 +4,8 @@ This is the main screen of the application.
 """
 
 from kivy.app import App
+from kivy.factory import Factory
+from kivy.lang import Builder
 from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
@@ -11,33 +13,99 @@ from kivy.uix.button import Button
 from kivy.uix.label import Label
 from kivy.uix.image import Image
 from kivy.metrics import dp
-from kivy.properties import ObjectProperty
-from kivy.logger import Logger
+
+from kivy_app.utils.ui import COLOR_GRAY, COLOR_BLUE, COLOR_GREEN
+
+# Metric conversions computed once at import; dp() re-runs the DPI
+# multiply on every call, which adds up across a screen build
+DP_5 = dp(5)
+DP_10 = dp(10)
+DP_14 = dp(14)
+DP_15 = dp(15)
+DP_20 = dp(20)
+DP_24 = dp(24)
+
+# One compiled rule stamped per feature: the canvas instructions and
+# position bindings are generated by the KV compiler instead of six
+# hand-built widget trees with per-tile update closures
+Builder.load_string('''
+<FeatureButton@BoxLayout>:
+    feature_name: ''
+    feature_icon: ''
+    feature_color: 0, 0, 0, 1
+    target_screen: ''
+    BoxLayout:
+        orientation: 'vertical'
+        padding: dp(15)
+        spacing: dp(10)
+        canvas.before:
+            Color:
+                rgba: root.feature_color
+            Rectangle:
+                pos: self.pos
+                size: self.size
+        Label:
+            text: root.feature_icon
+            font_size: dp(36)
+            size_hint: 1, 0.6
+        Label:
+            text: root.feature_name
+            font_size: dp(18)
+            size_hint: 1, 0.4
+    Button:
+        background_color: 0, 0, 0, 0
+        on_press: app.navigate_to(root.target_screen)
+''')
+
+# Feature specs (name, screen, icon, RGBA tuple) built once at import;
+# the per-build list/dict churn and color tuple reallocation go away.
+# Each button still needs its own Color instruction — Kivy canvases
+# can't share one node — but every instruction reuses these tuples
+_FEATURES = (
+    {'name': 'Sanskrit NLP', 'screen': 'sanskrit', 'icon': '🔤', 'color': COLOR_BLUE},
+    {'name': 'Code Generation', 'screen': 'code_generation', 'icon': '💻', 'color': COLOR_GREEN},
+    {'name': 'Instruction Learning', 'screen': 'instruction', 'icon': '🧠', 'color': (0.8, 0.4, 0.2, 1)},
+    {'name': 'Repository Analysis', 'screen': 'repository', 'icon': '📁', 'color': (0.6, 0.2, 0.6, 1)},
+    {'name': 'Data Comparison', 'screen': 'data_comparison', 'icon': '📊', 'color': (0.8, 0.6, 0.2, 1)},
+    {'name': 'Model Training', 'screen': 'model_training', 'icon': '⚙️', 'color': (0.5, 0.5, 0.5, 1)},
+)
 
 class HomeScreen(Screen):
     """Main home screen of the application."""
-    
+
+    # Content is built once on first entry and kept for the
+    # life of the app; clearing the tree must opt back in by
+    # resetting this flag
+    _content_built = False
+
+    # App reference cached on entry so handlers skip the
+    # registry lookup on every press
+    app = None
+
     def on_enter(self, *args):
         """Actions to perform when screen is entered."""
+        self.app = App.get_running_app()
+
         # Create content if not already created
-        if not self.children:
+        if not self._content_built:
             self.create_content()
-    
+            self._content_built = True
+
     def create_content(self):
         """Create the screen content."""
-        app = App.get_running_app()
+        app = self.app
         
         # Main layout
         main_layout = BoxLayout(
             orientation='vertical',
-            padding=dp(20),
-            spacing=dp(15)
+            padding=DP_20,
+            spacing=DP_15
         )
         
         # Header
         header = BoxLayout(
             size_hint=(1, 0.15),
-            spacing=dp(10)
+            spacing=DP_10
         )
         
         # App logo
@@ -51,19 +119,19 @@ class HomeScreen(Screen):
         title_box = BoxLayout(
             orientation='vertical',
             size_hint=(0.6, 1),
-            padding=[0, dp(10)]
+            padding=[0, DP_10]
         )
         
         title = Label(
             text='El AI Assistant',
-            font_size=dp(24),
+            font_size=DP_24,
             bold=True,
             size_hint=(1, 0.6)
         )
         
         version = Label(
             text=f'Version {app.version}',
-            font_size=dp(14),
+            font_size=DP_14,
             size_hint=(1, 0.4)
         )
         
@@ -74,25 +142,29 @@ class HomeScreen(Screen):
         buttons_box = BoxLayout(
             orientation='vertical',
             size_hint=(0.2, 1),
-            spacing=dp(5)
+            spacing=DP_5
         )
         
         settings_button = Button(
             text='Settings',
             size_hint=(1, 0.5),
             background_normal='',
-            background_color=(0.3, 0.3, 0.3, 1)
+            background_color=COLOR_GRAY
         )
         
         about_button = Button(
             text='About',
             size_hint=(1, 0.5),
             background_normal='',
-            background_color=(0.3, 0.3, 0.3, 1)
+            background_color=COLOR_GRAY
         )
         
-        settings_button.bind(on_press=lambda x: app.navigate_to('settings'))
-        about_button.bind(on_press=lambda x: app.navigate_to('about'))
+        # One shared handler reads the target from the button instead of
+        # a distinct closure per button
+        settings_button.target_screen = 'settings'
+        about_button.target_screen = 'about'
+        settings_button.bind(on_press=self._navigate)
+        about_button.bind(on_press=self._navigate)
         
         buttons_box.add_widget(settings_button)
         buttons_box.add_widget(about_button)
@@ -106,28 +178,18 @@ class HomeScreen(Screen):
         feature_grid = GridLayout(
             cols=2,
             size_hint=(1, 0.85),
-            spacing=dp(15),
-            padding=[0, dp(10)]
+            spacing=DP_15,
+            padding=[0, DP_10]
         )
         
-        # Create feature buttons
-        features = [
-            {'name': 'Sanskrit NLP', 'screen': 'sanskrit', 'icon': '🔤', 'color': (0.2, 0.6, 0.8, 1)},
-            {'name': 'Code Generation', 'screen': 'code_generation', 'icon': '💻', 'color': (0.2, 0.7, 0.3, 1)},
-            {'name': 'Instruction Learning', 'screen': 'instruction', 'icon': '🧠', 'color': (0.8, 0.4, 0.2, 1)},
-            {'name': 'Repository Analysis', 'screen': 'repository', 'icon': '📁', 'color': (0.6, 0.2, 0.6, 1)},
-            {'name': 'Data Comparison', 'screen': 'data_comparison', 'icon': '📊', 'color': (0.8, 0.6, 0.2, 1)},
-            {'name': 'Model Training', 'screen': 'model_training', 'icon': '⚙️', 'color': (0.5, 0.5, 0.5, 1)}
-        ]
-        
-        for feature in features:
-            feature_button = self._create_feature_button(
-                name=feature['name'],
-                icon=feature['icon'],
-                color=feature['color'],
-                screen=feature['screen']
-            )
-            feature_grid.add_widget(feature_button)
+        # Stamp one FeatureButton per feature spec
+        for feature in _FEATURES:
+            tile = Factory.FeatureButton()
+            tile.feature_name = feature['name']
+            tile.feature_icon = feature['icon']
+            tile.feature_color = feature['color']
+            tile.target_screen = feature['screen']
+            feature_grid.add_widget(tile)
         
         # Add all sections to main layout
         main_layout.add_widget(header)
@@ -136,55 +198,6 @@ class HomeScreen(Screen):
         # Add to screen
         self.add_widget(main_layout)
     
-    def _create_feature_button(self, name, icon, color, screen):
-        """Create a feature button with icon and label."""
-        app = App.get_running_app()
-        
-        button_layout = BoxLayout(
-            orientation='vertical',
-            padding=dp(15),
-            spacing=dp(10)
-        )
-        button_layout.background_color = color
-        
-        # Custom background using canvas
-        from kivy.graphics import Color, Rectangle
-        with button_layout.canvas.before:
-            Color(*color)
-            self.rect = Rectangle(pos=button_layout.pos, size=button_layout.size)
-        
-        button_layout.bind(pos=self._update_rect, size=self._update_rect)
-        
-        # Icon and text
-        icon_label = Label(
-            text=icon,
-            font_size=dp(36),
-            size_hint=(1, 0.6)
-        )
-        
-        name_label = Label(
-            text=name,
-            font_size=dp(18),
-            size_hint=(1, 0.4)
-        )
-        
-        button_layout.add_widget(icon_label)
-        button_layout.add_widget(name_label)
-        
-        # Make it clickable
-        button = Button(
-            background_color=(0, 0, 0, 0),  # Transparent
-            on_press=lambda x: app.navigate_to(screen)
-        )
-        
-        # Combine button and layout
-        container = BoxLayout()
-        container.add_widget(button_layout)
-        container.add_widget(button)
-        
-        return container
-    
-    def _update_rect(self, instance, value):
-        """Update rectangle position and size."""
-        self.rect.pos = instance.pos
-        self.rect.size = instance.size
\ No newline at end of file
+    def _navigate(self, instance):
+        """Shared press handler; the button carries its destination."""
+        self.app.navigate_to(instance.target_screen)
\ No newline at end of file
@@ -3,6 +3,9 @@ Instruction Screen Module.
 This module contains the screen for learning new instructions.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 from kivy.app import App
 from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
@@ -10,56 +13,66 @@ from kivy.uix.button import Button
 from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
 from kivy.metrics import dp
-from kivy.properties import ObjectProperty, StringProperty
+from kivy.properties import ObjectProperty
 from kivy.clock import Clock
-from kivy.logger import Logger
+
+from kivy_app.screens._common import ScreenHeader
+from kivy_app.utils.ui import COLOR_BLUE, COLOR_RED, sync_text_size
+
+# Metric conversions computed once at import; dp() re-runs the DPI
+# multiply on every call, which adds up across a screen build
+DP_10 = dp(10)
+DP_15 = dp(15)
+DP_20 = dp(20)
+
+# Persistent worker pool shared by all learning jobs; spawning a raw
+# Thread per click pays thread-creation cost each time and lets repeat
+# clicks pile up with no backpressure
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='nlp')
 
 class InstructionScreen(Screen):
     """Screen for learning new instructions."""
-    
+
+    # Content is built once on first entry and kept for the
+    # life of the app; clearing the tree must opt back in by
+    # resetting this flag
+    _content_built = False
+
+    # In-flight learning job, used to ignore duplicate clicks
+    _pending_future = None
+
+    # App reference cached on entry so handlers skip the
+    # registry lookup on every press
+    app = None
+
     instruction_input = ObjectProperty(None)
     results_label = ObjectProperty(None)
-    
+
     def on_enter(self, *args):
         """Actions to perform when screen is entered."""
-        app = App.get_running_app()
-        
+        self.app = App.get_running_app()
+
         # Create content if not already created
-        if not self.children:
+        if not self._content_built:
             self.create_content()
+            self._content_built = True
     
     def create_content(self):
         """Create the screen content."""
         # Main layout
-        layout = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(15))
+        layout = BoxLayout(orientation='vertical', padding=DP_20, spacing=DP_15)
         
         # Header
-        header = BoxLayout(size_hint=(1, 0.1), spacing=dp(10))
-        back_button = Button(
-            text='Back',
-            size_hint=(0.2, 1),
-            background_normal='',
-            background_color=(0.3, 0.3, 0.3, 1)
-        )
-        title_label = Label(
-            text='Instruction Learning',
-            font_size=dp(24),
-            bold=True,
-            size_hint=(0.8, 1)
-        )
-        
-        back_button.bind(on_press=lambda x: self._go_back())
-        
-        header.add_widget(back_button)
-        header.add_widget(title_label)
-        
+        header = ScreenHeader()
+        header.title = 'Instruction Learning'
+
         # Description
         description = Label(
             text='Teach the assistant by providing instructions',
             size_hint=(1, 0.1),
             halign='left'
         )
-        description.bind(size=description.setter('text_size'))
+        description.bind(size=sync_text_size)
         
         # Instruction input
         instruction_label = Label(
@@ -67,7 +80,7 @@ class InstructionScreen(Screen):
             size_hint=(1, 0.05),
             halign='left'
         )
-        instruction_label.bind(size=instruction_label.setter('text_size'))
+        instruction_label.bind(size=sync_text_size)
         
         self.instruction_input = TextInput(
             hint_text='Enter your instruction...',
@@ -76,20 +89,20 @@ class InstructionScreen(Screen):
         )
         
         # Action buttons
-        buttons_layout = BoxLayout(size_hint=(1, 0.1), spacing=dp(10))
+        buttons_layout = BoxLayout(size_hint=(1, 0.1), spacing=DP_10)
         
         learn_button = Button(
             text='Learn Instruction',
             size_hint=(0.7, 1),
             background_normal='',
-            background_color=(0.2, 0.6, 0.8, 1)
+            background_color=COLOR_BLUE
         )
         
         clear_button = Button(
             text='Clear',
             size_hint=(0.3, 1),
             background_normal='',
-            background_color=(0.7, 0.3, 0.3, 1)
+            background_color=COLOR_RED
         )
         
         learn_button.bind(on_press=lambda x: self._learn_instruction())
@@ -104,7 +117,7 @@ class InstructionScreen(Screen):
             size_hint=(1, 0.05),
             halign='left'
         )
-        results_label.bind(size=results_label.setter('text_size'))
+        results_label.bind(size=sync_text_size)
         
         self.results_label = TextInput(
             hint_text='Learning results will appear here...',
@@ -125,58 +138,66 @@ class InstructionScreen(Screen):
         # Add to screen
         self.add_widget(layout)
     
-    def _go_back(self):
-        """Return to the home screen."""
-        app = App.get_running_app()
-        app.navigate_to('home')
-    
     def _learn_instruction(self):
         """Learn an instruction."""
-        app = App.get_running_app()
+        app = self.app
         instruction = self.instruction_input.text.strip()
         
         if not instruction:
             app.notification_manager.warning('Please enter an instruction to learn')
             return
-        
+
+        # Ignore duplicate clicks while a job is still running
+        if self._pending_future is not None and not self._pending_future.done():
+            return
+
         # Show learning indicator
         self.results_label.text = 'Learning...'
         
-        # Use the Sanskrit NLP module to learn
+        # Use the Sanskrit NLP module to learn. The result string is
+        # assembled on the worker with one join so the main thread only
+        # assigns it
         def learn_thread():
             try:
                 result = app.sanskrit_nlp.learn_grammar_rule(instruction)
-                
-                # Update UI in the main thread
-                def update_ui(dt):
-                    if result.get('success'):
-                        output = f"Successfully learned rule: {result.get('rule', {}).get('name', '')}\n\n"
-                        output += f"Description: {result.get('rule', {}).get('description', '')}\n\n"
-                        
-                        # Show mappings/examples
-                        mappings = result.get('mappings', {})
-                        if mappings:
-                            output += "Examples:\n"
-                            for example, result_text in mappings.items():
-                                output += f"- '{example}' -> '{result_text}'\n"
-                        
-                        self.results_label.text = output
-                        app.notification_manager.success('Instruction learned successfully')
-                    else:
-                        self.results_label.text = f"Error: {result.get('error', 'Unknown error')}"
-                        app.notification_manager.error(f"Learning failed: {result.get('error', 'Unknown error')}")
-                
-                Clock.schedule_once(update_ui, 0)
-            
+
+                if result.get('success'):
+                    rule = result.get('rule', {})
+                    parts = [
+                        f"Successfully learned rule: {rule.get('name', '')}\n\n",
+                        f"Description: {rule.get('description', '')}\n\n",
+                    ]
+
+                    # Show mappings/examples
+                    mappings = result.get('mappings', {})
+                    if mappings:
+                        parts.append("Examples:\n")
+                        parts.extend(
+                            f"- '{example}' -> '{result_text}'\n"
+                            for example, result_text in mappings.items()
+                        )
+
+                    Clock.schedule_once(
+                        partial(self._show_result, ''.join(parts), None), 0)
+                else:
+                    error = result.get('error', 'Unknown error')
+                    Clock.schedule_once(
+                        partial(self._show_result, '', error), 0)
+
             except Exception as e:
-                def show_error(dt):
-                    self.results_label.text = f"Error: {str(e)}"
-                    app.notification_manager.error(f"Learning failed: {str(e)}")
-                
-                Clock.schedule_once(show_error, 0)
-        
-        from threading import Thread
-        Thread(target=learn_thread).start()
+                Clock.schedule_once(
+                    partial(self._show_result, '', str(e)), 0)
+
+        self._pending_future = _EXECUTOR.submit(learn_thread)
+
+    def _show_result(self, output, error, dt):
+        """Apply a finished learning result on the main thread."""
+        if error is None:
+            self.results_label.text = output
+            self.app.notification_manager.success('Instruction learned successfully')
+        else:
+            self.results_label.text = f"Error: {error}"
+            self.app.notification_manager.error(f"Learning failed: {error}")
     
     def _clear_inputs(self):
         """Clear the instruction and results."""
@@ -10,6 +10,15 @@ from kivy.uix.button import Button
 from kivy.uix.label import Label
 from kivy.metrics import dp
 
+from kivy_app.utils.ui import COLOR_GRAY
+
+# Metric conversions computed once at import; dp() re-runs the DPI
+# multiply on every call, which adds up across a screen build
+DP_10 = dp(10)
+DP_15 = dp(15)
+DP_20 = dp(20)
+DP_24 = dp(24)
+
 class RepositoryScreen(Screen):
     """Screen for repository analysis."""
     
@@ -24,19 +33,19 @@ class RepositoryScreen(Screen):
     def create_content(self):
         """Create the screen content."""
         # Main layout
-        layout = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(15))
+        layout = BoxLayout(orientation='vertical', padding=DP_20, spacing=DP_15)
         
         # Header
-        header = BoxLayout(size_hint=(1, 0.1), spacing=dp(10))
+        header = BoxLayout(size_hint=(1, 0.1), spacing=DP_10)
         back_button = Button(
             text='Back',
             size_hint=(0.2, 1),
             background_normal='',
-            background_color=(0.3, 0.3, 0.3, 1)
+            background_color=COLOR_GRAY
         )
         title_label = Label(
             text='Repository Analysis',
-            font_size=dp(24),
+            font_size=DP_24,
             bold=True,
             size_hint=(0.8, 1)
         )
@@ -50,7 +59,7 @@ class RepositoryScreen(Screen):
         placeholder = Label(
             text='Repository Analysis\nFeature coming soon!',
             size_hint=(1, 0.9),
-            font_size=dp(20)
+            font_size=DP_20
         )
         
         # Add all elements to the main layout
@@ -3,597 +3,501 @@ Sanskrit Screen Module.
 This screen provides Sanskrit language processing capabilities.
 """
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+
 from kivy.app import App
+from kivy.clock import Clock
+from kivy.factory import Factory
+from kivy.lang import Builder
 from kivy.uix.screenmanager import Screen
-from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.gridlayout import GridLayout
-from kivy.uix.scrollview import ScrollView
-from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
-from kivy.uix.button import Button
-from kivy.uix.spinner import Spinner
-from kivy.metrics import dp
-from kivy.properties import StringProperty
-from kivy.logger import Logger
+
+# Imported for its side effect as well: registers the ScreenHeader and
+# ResultsView rules used in the KV template below
+from kivy_app.screens import _common
+from kivy_app.utils.ui import COLOR_GRAY
+
+# Persistent worker pool for the NLP calls; running them on the UI
+# thread stalls the frame loop for long inputs
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='sanskrit')
+
+# Spinner text -> SanskritNLP scheme name, built once instead of per
+# button press
+_SCHEME_MAP = {
+    'iast': 'iast',
+    'devanagari': 'devanagari',
+    'harvard-kyoto': 'hk',
+}
+
+# Inputs longer than this bypass the memo caches to bound their memory
+_CACHE_TEXT_LIMIT = 4096
+
+# Fixed rule-display templates formatted once per rule instead of one
+# f-string allocation per line; missing keys render as empty strings
+# via a defaultdict wrapper
+_RULE_TEMPLATE = "Rule {id}:\n  Description: {description}\n"
+_RULE_PATTERN_TEMPLATE = "  Pattern: {pattern}\n  Replacement: {replacement}\n"
+_RULE_CREATED_TEMPLATE = "  Created: {created_at}\n\n"
+
+
+# The layout lives in KV templates compiled once at import; the KV
+# parser instantiates each subtree with batched property application
+# instead of dozens of Python-side constructor-and-bind calls.
+# NlpTab covers the three tabs that share the explanation / input /
+# action / virtualized-result shape; the transliterate tab keeps its
+# own rule for the scheme spinners and copyable TextInput result
+KV = '''
+<NlpTab@BoxLayout>:
+    explanation: ''
+    input_title: 'Input Text:'
+    input_hint: ''
+    action_text: ''
+    result_title: 'Result:'
+    orientation: 'vertical'
+    spacing: dp(10)
+    Label:
+        text: root.explanation
+        size_hint: 1, 0.1
+        halign: 'left'
+        valign: 'top'
+        text_size: self.size
+    BoxLayout:
+        orientation: 'vertical'
+        size_hint: 1, 0.35
+        spacing: dp(5)
+        Label:
+            text: root.input_title
+            size_hint: 1, 0.2
+            halign: 'left'
+            text_size: self.size
+        TextInput:
+            id: input_field
+            hint_text: root.input_hint
+            size_hint: 1, 0.8
+            multiline: True
+    Button:
+        id: action_button
+        text: root.action_text
+        size_hint: 0.5, 0.1
+        pos_hint: {'center_x': 0.5}
+    BoxLayout:
+        orientation: 'vertical'
+        size_hint: 1, 0.35
+        spacing: dp(5)
+        Label:
+            text: root.result_title
+            size_hint: 1, 0.2
+            halign: 'left'
+            text_size: self.size
+        ResultsView:
+            id: result_view
+            size_hint: 1, 0.8
+
+<TransliterateTab@BoxLayout>:
+    orientation: 'vertical'
+    spacing: dp(10)
+    Label:
+        text: 'Convert Sanskrit text between different writing systems'
+        size_hint: 1, 0.1
+        halign: 'left'
+        valign: 'top'
+        text_size: self.size
+    BoxLayout:
+        orientation: 'vertical'
+        size_hint: 1, 0.35
+        spacing: dp(5)
+        Label:
+            text: 'Input Text:'
+            size_hint: 1, 0.2
+            halign: 'left'
+            text_size: self.size
+        TextInput:
+            id: input_field
+            hint_text: 'Enter Sanskrit text to transliterate'
+            size_hint: 1, 0.6
+            multiline: True
+        BoxLayout:
+            size_hint: 1, 0.2
+            spacing: dp(10)
+            Label:
+                text: 'From:'
+                size_hint: 0.15, 1
+            Spinner:
+                id: from_scheme
+                text: 'IAST'
+                values: ('IAST', 'Devanagari', 'Harvard-Kyoto')
+                size_hint: 0.35, 1
+            Label:
+                text: 'To:'
+                size_hint: 0.15, 1
+            Spinner:
+                id: to_scheme
+                text: 'Devanagari'
+                values: ('IAST', 'Devanagari', 'Harvard-Kyoto')
+                size_hint: 0.35, 1
+    Button:
+        id: action_button
+        text: 'Transliterate'
+        size_hint: 0.5, 0.1
+        pos_hint: {'center_x': 0.5}
+    BoxLayout:
+        orientation: 'vertical'
+        size_hint: 1, 0.35
+        spacing: dp(5)
+        Label:
+            text: 'Result:'
+            size_hint: 1, 0.2
+            halign: 'left'
+            text_size: self.size
+        TextInput:
+            id: result_field
+            readonly: True
+            size_hint: 1, 0.8
+
+<SanskritContent@BoxLayout>:
+    orientation: 'vertical'
+    padding: dp(20)
+    spacing: dp(15)
+    ScreenHeader:
+        title: 'Sanskrit NLP'
+    BoxLayout:
+        orientation: 'vertical'
+        size_hint: 1, 0.9
+        BoxLayout:
+            size_hint: 1, 0.08
+            spacing: dp(2)
+            Button:
+                id: transliterate_button
+                text: 'Transliterate'
+                background_normal: ''
+                background_color: 0.3, 0.5, 0.9, 1
+            Button:
+                id: tokenize_button
+                text: 'Tokenize'
+                background_normal: ''
+                background_color: 0.3, 0.3, 0.3, 1
+            Button:
+                id: sandhi_button
+                text: 'Sandhi Analysis'
+                background_normal: ''
+                background_color: 0.3, 0.3, 0.3, 1
+            Button:
+                id: learn_button
+                text: 'Learn Rules'
+                background_normal: ''
+                background_color: 0.3, 0.3, 0.3, 1
+        BoxLayout:
+            id: tab_content
+            size_hint: 1, 0.92
+'''
+Builder.load_string(KV)
+
+
+# Transliteration and tokenization are pure functions of their inputs,
+# so repeat clicks on unchanged text return instantly. Sandhi analysis
+# is deliberately not cached: learned grammar rules change its output
+@lru_cache(maxsize=256)
+def _cached_transliterate(nlp, text, from_scheme, to_scheme):
+    return nlp.transliterate(text, from_scheme, to_scheme)
+
+
+@lru_cache(maxsize=256)
+def _cached_tokenize(nlp, text):
+    return nlp.tokenize(text)
+
+
+def _set_lines(view, text):
+    """Populate a ResultsView from a newline-joined string."""
+    view.data = [{'text': line} for line in text.split('\n')] if text else []
 
 class SanskritScreen(Screen):
     """Screen for Sanskrit language processing."""
-    
+
+    # Scheduled trigger used to debounce the NLP buttons; mashing a
+    # button coalesces into one analysis instead of one per press
+    _pending = None
+
+    # App reference cached on entry so handlers skip the
+    # registry lookup on every press
+    app = None
+
     def on_enter(self, *args):
         """Actions to perform when screen is entered."""
+        self.app = App.get_running_app()
+
         # Create content if not already created
         if not self.children:
             self.create_content()
     
     def create_content(self):
-        """Create the screen content."""
-        # Main layout
-        main_layout = BoxLayout(
-            orientation='vertical',
-            padding=dp(20),
-            spacing=dp(15)
-        )
-        
-        # Header with back button
-        header = BoxLayout(
-            size_hint=(1, 0.1),
-            spacing=dp(10)
-        )
-        
-        back_button = Button(
-            text='Back',
-            size_hint=(0.2, 1),
-            background_normal='',
-            background_color=(0.3, 0.3, 0.3, 1)
-        )
-        back_button.bind(on_press=self._on_back_pressed)
-        
-        title = Label(
-            text='Sanskrit NLP',
-            font_size=dp(24),
-            bold=True,
-            size_hint=(0.8, 1)
-        )
-        
-        header.add_widget(back_button)
-        header.add_widget(title)
-        
-        # Content in a tab-like structure
-        tab_layout = BoxLayout(
-            orientation='vertical',
-            size_hint=(1, 0.9)
-        )
-        
-        # Tabs buttons
-        tabs_buttons = BoxLayout(
-            size_hint=(1, 0.08),
-            spacing=dp(2)
-        )
-        
-        transliterate_button = Button(
-            text='Transliterate',
-            background_normal='',
-            background_color=(0.3, 0.5, 0.9, 1)
-        )
-        
-        tokenize_button = Button(
-            text='Tokenize',
-            background_normal='',
-            background_color=(0.3, 0.3, 0.3, 1)
-        )
-        
-        sandhi_button = Button(
-            text='Sandhi Analysis',
-            background_normal='',
-            background_color=(0.3, 0.3, 0.3, 1)
-        )
-        
-        learn_button = Button(
-            text='Learn Rules',
-            background_normal='',
-            background_color=(0.3, 0.3, 0.3, 1)
-        )
-        
-        # Bind tab buttons
-        transliterate_button.bind(on_press=lambda x: self._switch_tab('transliterate'))
-        tokenize_button.bind(on_press=lambda x: self._switch_tab('tokenize'))
-        sandhi_button.bind(on_press=lambda x: self._switch_tab('sandhi'))
-        learn_button.bind(on_press=lambda x: self._switch_tab('learn'))
-        
-        tabs_buttons.add_widget(transliterate_button)
-        tabs_buttons.add_widget(tokenize_button)
-        tabs_buttons.add_widget(sandhi_button)
-        tabs_buttons.add_widget(learn_button)
-        
-        # Tab content layout
-        self.tab_content = BoxLayout(
-            size_hint=(1, 0.92)
-        )
-        
+        """Create the screen content from the KV template."""
+        content = Factory.SanskritContent()
+        ids = content.ids
+
+        self.tab_content = ids.tab_content
+
         # Store button references
         self.tab_buttons = {
-            'transliterate': transliterate_button,
-            'tokenize': tokenize_button,
-            'sandhi': sandhi_button,
-            'learn': learn_button
+            'transliterate': ids.transliterate_button,
+            'tokenize': ids.tokenize_button,
+            'sandhi': ids.sandhi_button,
+            'learn': ids.learn_button
         }
-        
-        # Add tabs and content to tab layout
-        tab_layout.add_widget(tabs_buttons)
-        tab_layout.add_widget(self.tab_content)
-        
-        # Add header and tab layout to main layout
-        main_layout.add_widget(header)
-        main_layout.add_widget(tab_layout)
-        
+
+        # One shared handler reads the target tab from the button
+        for name, button in self.tab_buttons.items():
+            button.tab_name = name
+            button.bind(on_press=self._on_tab_pressed)
+
+        # Built tab subtrees, keyed by tab name; switching back to a
+        # visited tab reattaches the cached tree instead of rebuilding
+        # every widget and binding from scratch
+        self._tab_cache = {}
+        self._tab_builders = {
+            'transliterate': self._create_transliterate_tab,
+            'tokenize': self._create_tokenize_tab,
+            'sandhi': self._create_sandhi_tab,
+            'learn': self._create_learn_tab
+        }
+
         # Add main layout to screen
-        self.add_widget(main_layout)
-        
-        # Initially show transliterate tab
+        self.add_widget(content)
+
+        # Build the first tab on the next frame so the header and tab
+        # bar render immediately on entry instead of after the whole
+        # tab subtree is constructed
+        Clock.schedule_once(self._show_initial_tab, 0)
+
+    def _show_initial_tab(self, dt):
+        """Build and show the transliterate tab after first paint."""
         self._switch_tab('transliterate')
-    
+
+    def _on_tab_pressed(self, instance):
+        """Shared tab-button handler; the button carries its tab."""
+        self._switch_tab(instance.tab_name)
+
     def _switch_tab(self, tab_name):
         """
         Switch to a specific tab.
-        
+
         Args:
             tab_name (str): Name of the tab to switch to
         """
         # Reset all tab buttons to default color
         for button in self.tab_buttons.values():
-            button.background_color = (0.3, 0.3, 0.3, 1)
-        
+            button.background_color = COLOR_GRAY
+
         # Highlight the active tab
         self.tab_buttons[tab_name].background_color = (0.3, 0.5, 0.9, 1)
-        
-        # Clear current content
+
+        # Build the tab on first visit, then reuse the cached tree
+        widget = self._tab_cache.get(tab_name)
+        if widget is None:
+            widget = self._tab_builders[tab_name]()
+            self._tab_cache[tab_name] = widget
+
+        # Swap the displayed content
         self.tab_content.clear_widgets()
-        
-        # Add new content based on selected tab
-        if tab_name == 'transliterate':
-            self.tab_content.add_widget(self._create_transliterate_tab())
-        elif tab_name == 'tokenize':
-            self.tab_content.add_widget(self._create_tokenize_tab())
-        elif tab_name == 'sandhi':
-            self.tab_content.add_widget(self._create_sandhi_tab())
-        elif tab_name == 'learn':
-            self.tab_content.add_widget(self._create_learn_tab())
-    
+        self.tab_content.add_widget(widget)
+
     def _create_transliterate_tab(self):
         """Create the transliterate tab content."""
-        tab = BoxLayout(
-            orientation='vertical',
-            spacing=dp(10)
-        )
-        
-        # Explanation
-        explanation = Label(
-            text='Convert Sanskrit text between different writing systems',
-            size_hint=(1, 0.1),
-            halign='left',
-            valign='top'
-        )
-        explanation.bind(size=explanation.setter('text_size'))
-        
-        # Input section
-        input_section = BoxLayout(
-            orientation='vertical',
-            size_hint=(1, 0.35),
-            spacing=dp(5)
-        )
-        
-        input_header = Label(
-            text='Input Text:',
-            size_hint=(1, 0.2),
-            halign='left'
-        )
-        input_header.bind(size=input_header.setter('text_size'))
-        
-        # Text input
-        self.transliterate_input = TextInput(
-            hint_text='Enter Sanskrit text to transliterate',
-            size_hint=(1, 0.6),
-            multiline=True
-        )
-        
-        # Scheme selection
-        schemes_layout = BoxLayout(
-            size_hint=(1, 0.2),
-            spacing=dp(10)
-        )
-        
-        from_label = Label(
-            text='From:',
-            size_hint=(0.15, 1)
-        )
-        
-        self.from_scheme = Spinner(
-            text='IAST',
-            values=('IAST', 'Devanagari', 'Harvard-Kyoto'),
-            size_hint=(0.35, 1)
-        )
-        
-        to_label = Label(
-            text='To:',
-            size_hint=(0.15, 1)
-        )
-        
-        self.to_scheme = Spinner(
-            text='Devanagari',
-            values=('IAST', 'Devanagari', 'Harvard-Kyoto'),
-            size_hint=(0.35, 1)
-        )
-        
-        schemes_layout.add_widget(from_label)
-        schemes_layout.add_widget(self.from_scheme)
-        schemes_layout.add_widget(to_label)
-        schemes_layout.add_widget(self.to_scheme)
-        
-        input_section.add_widget(input_header)
-        input_section.add_widget(self.transliterate_input)
-        input_section.add_widget(schemes_layout)
-        
-        # Transliterate button
-        transliterate_button = Button(
-            text='Transliterate',
-            size_hint=(0.5, 0.1),
-            pos_hint={'center_x': 0.5}
-        )
-        transliterate_button.bind(on_press=self._on_transliterate)
-        
-        # Result section
-        result_section = BoxLayout(
-            orientation='vertical',
-            size_hint=(1, 0.35),
-            spacing=dp(5)
-        )
-        
-        result_header = Label(
-            text='Result:',
-            size_hint=(1, 0.2),
-            halign='left'
-        )
-        result_header.bind(size=result_header.setter('text_size'))
-        
-        # Result display
-        self.transliterate_result = TextInput(
-            readonly=True,
-            size_hint=(1, 0.8)
-        )
-        
-        result_section.add_widget(result_header)
-        result_section.add_widget(self.transliterate_result)
-        
-        # Add sections to tab
-        tab.add_widget(explanation)
-        tab.add_widget(input_section)
-        tab.add_widget(transliterate_button)
-        tab.add_widget(result_section)
-        
+        tab = Factory.TransliterateTab()
+        ids = tab.ids
+
+        self.transliterate_input = ids.input_field
+        self.from_scheme = ids.from_scheme
+        self.to_scheme = ids.to_scheme
+        self.transliterate_result = ids.result_field
+        ids.action_button.bind(on_press=self._on_transliterate)
+
         return tab
-    
+
     def _create_tokenize_tab(self):
         """Create the tokenize tab content."""
-        tab = BoxLayout(
-            orientation='vertical',
-            spacing=dp(10)
-        )
-        
-        # Explanation
-        explanation = Label(
-            text='Break Sanskrit text into words and morphemes',
-            size_hint=(1, 0.1),
-            halign='left',
-            valign='top'
-        )
-        explanation.bind(size=explanation.setter('text_size'))
-        
-        # Input section
-        input_section = BoxLayout(
-            orientation='vertical',
-            size_hint=(1, 0.35),
-            spacing=dp(5)
-        )
-        
-        input_header = Label(
-            text='Input Text:',
-            size_hint=(1, 0.2),
-            halign='left'
-        )
-        input_header.bind(size=input_header.setter('text_size'))
-        
-        # Text input
-        self.tokenize_input = TextInput(
-            hint_text='Enter Sanskrit text to tokenize',
-            size_hint=(1, 0.8),
-            multiline=True
-        )
-        
-        input_section.add_widget(input_header)
-        input_section.add_widget(self.tokenize_input)
-        
-        # Tokenize button
-        tokenize_button = Button(
-            text='Tokenize',
-            size_hint=(0.5, 0.1),
-            pos_hint={'center_x': 0.5}
-        )
-        tokenize_button.bind(on_press=self._on_tokenize)
-        
-        # Result section
-        result_section = BoxLayout(
-            orientation='vertical',
-            size_hint=(1, 0.35),
-            spacing=dp(5)
-        )
-        
-        result_header = Label(
-            text='Tokens:',
-            size_hint=(1, 0.2),
-            halign='left'
-        )
-        result_header.bind(size=result_header.setter('text_size'))
-        
-        # Result display
-        self.tokenize_result = TextInput(
-            readonly=True,
-            size_hint=(1, 0.8)
-        )
-        
-        result_section.add_widget(result_header)
-        result_section.add_widget(self.tokenize_result)
-        
-        # Add sections to tab
-        tab.add_widget(explanation)
-        tab.add_widget(input_section)
-        tab.add_widget(tokenize_button)
-        tab.add_widget(result_section)
-        
+        tab = Factory.NlpTab()
+        tab.explanation = 'Break Sanskrit text into words and morphemes'
+        tab.input_hint = 'Enter Sanskrit text to tokenize'
+        tab.action_text = 'Tokenize'
+        tab.result_title = 'Tokens:'
+
+        ids = tab.ids
+        self.tokenize_input = ids.input_field
+        self.tokenize_result = ids.result_view
+        ids.action_button.bind(on_press=self._on_tokenize)
+
         return tab
-    
+
     def _create_sandhi_tab(self):
         """Create the sandhi analysis tab content."""
-        tab = BoxLayout(
-            orientation='vertical',
-            spacing=dp(10)
-        )
-        
-        # Explanation
-        explanation = Label(
-            text='Analyze sandhi (phonological fusion) in Sanskrit text',
-            size_hint=(1, 0.1),
-            halign='left',
-            valign='top'
-        )
-        explanation.bind(size=explanation.setter('text_size'))
-        
-        # Input section
-        input_section = BoxLayout(
-            orientation='vertical',
-            size_hint=(1, 0.35),
-            spacing=dp(5)
-        )
-        
-        input_header = Label(
-            text='Input Text:',
-            size_hint=(1, 0.2),
-            halign='left'
-        )
-        input_header.bind(size=input_header.setter('text_size'))
-        
-        # Text input
-        self.sandhi_input = TextInput(
-            hint_text='Enter Sanskrit text to analyze sandhi',
-            size_hint=(1, 0.8),
-            multiline=True
-        )
-        
-        input_section.add_widget(input_header)
-        input_section.add_widget(self.sandhi_input)
-        
-        # Analyze button
-        analyze_button = Button(
-            text='Analyze Sandhi',
-            size_hint=(0.5, 0.1),
-            pos_hint={'center_x': 0.5}
-        )
-        analyze_button.bind(on_press=self._on_analyze_sandhi)
-        
-        # Result section
-        result_section = BoxLayout(
-            orientation='vertical',
-            size_hint=(1, 0.35),
-            spacing=dp(5)
-        )
-        
-        result_header = Label(
-            text='Sandhi Analysis:',
-            size_hint=(1, 0.2),
-            halign='left'
-        )
-        result_header.bind(size=result_header.setter('text_size'))
-        
-        # Result display in a scrollview
-        result_scroll = ScrollView(
-            size_hint=(1, 0.8)
-        )
-        
-        self.sandhi_result = TextInput(
-            readonly=True,
-            size_hint=(1, None)
-        )
-        self.sandhi_result.bind(minimum_height=self.sandhi_result.setter('height'))
-        
-        result_scroll.add_widget(self.sandhi_result)
-        result_section.add_widget(result_header)
-        result_section.add_widget(result_scroll)
-        
-        # Add sections to tab
-        tab.add_widget(explanation)
-        tab.add_widget(input_section)
-        tab.add_widget(analyze_button)
-        tab.add_widget(result_section)
-        
+        tab = Factory.NlpTab()
+        tab.explanation = 'Analyze sandhi (phonological fusion) in Sanskrit text'
+        tab.input_hint = 'Enter Sanskrit text to analyze sandhi'
+        tab.action_text = 'Analyze Sandhi'
+        tab.result_title = 'Sandhi Analysis:'
+
+        ids = tab.ids
+        self.sandhi_input = ids.input_field
+        self.sandhi_result = ids.result_view
+        ids.action_button.bind(on_press=self._on_analyze_sandhi)
+
         return tab
-    
+
     def _create_learn_tab(self):
         """Create the learn grammar rules tab content."""
-        tab = BoxLayout(
-            orientation='vertical',
-            spacing=dp(10)
-        )
-        
-        # Explanation
-        explanation = Label(
-            text='Teach the system new Sanskrit grammar rules',
-            size_hint=(1, 0.1),
-            halign='left',
-            valign='top'
-        )
-        explanation.bind(size=explanation.setter('text_size'))
-        
-        # Input section
-        input_section = BoxLayout(
-            orientation='vertical',
-            size_hint=(1, 0.4),
-            spacing=dp(5)
-        )
-        
-        input_header = Label(
-            text='Rule Description:',
-            size_hint=(1, 0.2),
-            halign='left'
-        )
-        input_header.bind(size=input_header.setter('text_size'))
-        
-        # Text input
-        self.learn_input = TextInput(
-            hint_text='Describe a Sanskrit grammar rule (e.g., "When a ends with a and b starts with i, a+b becomes ai")',
-            size_hint=(1, 0.8),
-            multiline=True
-        )
-        
-        input_section.add_widget(input_header)
-        input_section.add_widget(self.learn_input)
-        
-        # Learn button
-        learn_button = Button(
-            text='Add Rule',
-            size_hint=(0.5, 0.1),
-            pos_hint={'center_x': 0.5}
-        )
-        learn_button.bind(on_press=self._on_learn_rule)
-        
-        # Existing rules section
-        rules_section = BoxLayout(
-            orientation='vertical',
-            size_hint=(1, 0.3),
-            spacing=dp(5)
-        )
-        
-        rules_header = Label(
-            text='Existing Rules:',
-            size_hint=(1, 0.2),
-            halign='left'
-        )
-        rules_header.bind(size=rules_header.setter('text_size'))
-        
-        # Rules display in a scrollview
-        rules_scroll = ScrollView(
-            size_hint=(1, 0.8)
-        )
-        
-        self.rules_display = TextInput(
-            readonly=True,
-            size_hint=(1, None)
-        )
-        self.rules_display.bind(minimum_height=self.rules_display.setter('height'))
-        
-        rules_scroll.add_widget(self.rules_display)
-        rules_section.add_widget(rules_header)
-        rules_section.add_widget(rules_scroll)
-        
-        # Add sections to tab
-        tab.add_widget(explanation)
-        tab.add_widget(input_section)
-        tab.add_widget(learn_button)
-        tab.add_widget(rules_section)
-        
+        tab = Factory.NlpTab()
+        tab.explanation = 'Teach the system new Sanskrit grammar rules'
+        tab.input_title = 'Rule Description:'
+        tab.input_hint = ('Describe a Sanskrit grammar rule (e.g., "When a '
+                          'ends with a and b starts with i, a+b becomes ai")')
+        tab.action_text = 'Add Rule'
+        tab.result_title = 'Existing Rules:'
+
+        ids = tab.ids
+        self.learn_input = ids.input_field
+        self.rules_display = ids.result_view
+        ids.action_button.bind(on_press=self._on_learn_rule)
+
         # Load existing rules when tab is created
         self._load_existing_rules()
-        
+
         return tab
-    
-    def _on_back_pressed(self, instance):
-        """Handle back button press."""
-        app = App.get_running_app()
-        app.navigate_to('home')
-    
+
+
+    def _debounce(self, callback):
+        """Coalesce rapid presses into one scheduled call."""
+        if self._pending is not None:
+            self._pending.cancel()
+        self._pending = Clock.schedule_once(callback, 0.15)
+
     def _on_transliterate(self, instance):
-        """Handle transliterate button press."""
-        app = App.get_running_app()
-        
-        text = self.transliterate_input.text.strip()
-        if not text:
+        """Handle transliterate button press (debounced)."""
+        self._debounce(self._do_transliterate)
+
+    def _do_transliterate(self, dt):
+        """Run the transliterate request after the debounce window."""
+        app = self.app
+        
+        # Reject empty input before strip() copies a possibly
+        # huge buffer
+        raw = self.transliterate_input.text
+        if not raw or raw.isspace():
             app.notification_manager.warning("Please enter text to transliterate")
             return
+        text = raw.strip()
         
-        # Get selected schemes
-        from_scheme = self.from_scheme.text.lower()
-        to_scheme = self.to_scheme.text.lower()
-        
-        # Convert scheme names to match SanskritNLP implementation
-        scheme_map = {
-            'iast': 'iast',
-            'devanagari': 'devanagari',
-            'harvard-kyoto': 'hk'
-        }
-        
-        from_scheme = scheme_map.get(from_scheme, 'iast')
-        to_scheme = scheme_map.get(to_scheme, 'devanagari')
-        
-        # Perform transliteration
-        result = app.sanskrit_nlp.transliterate(text, from_scheme, to_scheme)
-        
-        if result['success']:
-            self.transliterate_result.text = result['text']
-        else:
-            app.notification_manager.error(f"Transliteration failed: {result.get('error', 'Unknown error')}")
-    
+        # Map the selected spinner text to SanskritNLP scheme names
+        from_scheme = _SCHEME_MAP.get(self.from_scheme.text.lower(), 'iast')
+        to_scheme = _SCHEME_MAP.get(self.to_scheme.text.lower(), 'devanagari')
+
+        # Perform transliteration off the UI thread
+        self.transliterate_result.text = 'Transliterating...'
+        _EXECUTOR.submit(self._transliterate_worker, app, text, from_scheme, to_scheme)
+
+    def _transliterate_worker(self, app, text, from_scheme, to_scheme):
+        """Run transliteration on the worker pool."""
+        try:
+            if len(text) > _CACHE_TEXT_LIMIT:
+                result = app.sanskrit_nlp.transliterate(text, from_scheme, to_scheme)
+            else:
+                result = _cached_transliterate(
+                    app.sanskrit_nlp, text, from_scheme, to_scheme)
+            if result['success']:
+                self._apply_result(self.transliterate_result, result['text'], None)
+            else:
+                self._apply_result(
+                    self.transliterate_result, '',
+                    f"Transliteration failed: {result.get('error', 'Unknown error')}")
+        except Exception as e:
+            self._apply_result(
+                self.transliterate_result, '', f"Transliteration failed: {e}")
+
     def _on_tokenize(self, instance):
-        """Handle tokenize button press."""
-        app = App.get_running_app()
-        
-        text = self.tokenize_input.text.strip()
-        if not text:
+        """Handle tokenize button press (debounced)."""
+        self._debounce(self._do_tokenize)
+
+    def _do_tokenize(self, dt):
+        """Run the tokenize request after the debounce window."""
+        app = self.app
+
+        # Reject empty input before strip() copies a possibly
+        # huge buffer
+        raw = self.tokenize_input.text
+        if not raw or raw.isspace():
             app.notification_manager.warning("Please enter text to tokenize")
             return
-        
-        # Perform tokenization
-        result = app.sanskrit_nlp.tokenize(text)
-        
-        if result['success']:
-            # Format tokens for display
-            tokens = result['tokens']
-            self.tokenize_result.text = '\n'.join([f"{i+1}. {token}" for i, token in enumerate(tokens)])
-        else:
-            app.notification_manager.error(f"Tokenization failed: {result.get('error', 'Unknown error')}")
-    
+        text = raw.strip()
+
+        # Perform tokenization off the UI thread
+        _set_lines(self.tokenize_result, 'Tokenizing...')
+        _EXECUTOR.submit(self._tokenize_worker, app, text)
+
+    def _tokenize_worker(self, app, text):
+        """Run tokenization on the worker pool."""
+        try:
+            if len(text) > _CACHE_TEXT_LIMIT:
+                result = app.sanskrit_nlp.tokenize(text)
+            else:
+                result = _cached_tokenize(app.sanskrit_nlp, text)
+            if result['success']:
+                # Build the RecycleView rows directly while still off
+                # the UI thread; no joined string is materialized and
+                # only visible rows ever become widgets
+                tokens = result['tokens']
+                rows = [{'text': f"{i+1}. {token}"}
+                        for i, token in enumerate(tokens)]
+                Clock.schedule_once(
+                    partial(self._show_rows, self.tokenize_result, rows), 0)
+            else:
+                self._apply_result(
+                    self.tokenize_result, '',
+                    f"Tokenization failed: {result.get('error', 'Unknown error')}")
+        except Exception as e:
+            self._apply_result(self.tokenize_result, '', f"Tokenization failed: {e}")
+
     def _on_analyze_sandhi(self, instance):
-        """Handle analyze sandhi button press."""
-        app = App.get_running_app()
-        
-        text = self.sandhi_input.text.strip()
-        if not text:
+        """Handle analyze sandhi button press (debounced)."""
+        self._debounce(self._do_analyze_sandhi)
+
+    def _do_analyze_sandhi(self, dt):
+        """Run the sandhi request after the debounce window."""
+        app = self.app
+
+        # Reject empty input before strip() copies a possibly
+        # huge buffer
+        raw = self.sandhi_input.text
+        if not raw or raw.isspace():
             app.notification_manager.warning("Please enter text to analyze")
             return
-        
-        # Perform sandhi analysis
-        result = app.sanskrit_nlp.analyze_sandhi(text)
-        
-        if result['success']:
-            # Format analysis for display
-            analysis = result['analysis']
+        text = raw.strip()
+
+        # Perform sandhi analysis off the UI thread
+        _set_lines(self.sandhi_result, 'Analyzing...')
+        _EXECUTOR.submit(self._sandhi_worker, app, text)
+
+    def _sandhi_worker(self, app, text):
+        """Run sandhi analysis on the worker pool."""
+        try:
+            # Analyze each non-empty line separately and merge, so a
+            # pasted multi-paragraph document produces per-line results
+            # instead of one analysis of the whole blob. The backend is
+            # pure Python under the GIL, so the lines run sequentially
+            # on this worker; a per-line thread fan-out would only add
+            # dispatch overhead
+            chunks = [line for line in text.splitlines() if line.strip()] or [text]
+            analysis = []
+            for chunk in chunks:
+                result = app.sanskrit_nlp.analyze_sandhi(chunk)
+                if not result['success']:
+                    self._apply_result(
+                        self.sandhi_result, '',
+                        f"Sandhi analysis failed: {result.get('error', 'Unknown error')}")
+                    return
+                analysis.extend(result['analysis'])
+
+            # Format the merged analysis while still off the UI thread
             if analysis:
                 display_text = []
                 for i, item in enumerate(analysis):
@@ -603,21 +507,44 @@ class SanskritScreen(Screen):
                     display_text.append(f"  Combined: {item.get('combined', '')}")
                     display_text.append(f"  Type: {item.get('type', '')}")
                     display_text.append("")
-                
-                self.sandhi_result.text = '\n'.join(display_text)
+                display = '\n'.join(display_text)
             else:
-                self.sandhi_result.text = "No sandhi combinations detected in the text."
+                display = "No sandhi combinations detected in the text."
+            self._apply_result(self.sandhi_result, display, None)
+        except Exception as e:
+            self._apply_result(self.sandhi_result, '', f"Sandhi analysis failed: {e}")
+
+    def _apply_result(self, field, text, error):
+        """Marshal a finished worker result onto the main thread."""
+        Clock.schedule_once(partial(self._show_result, field, text, error), 0)
+
+    @staticmethod
+    def _show_rows(view, rows, dt):
+        """Apply prebuilt rows to a ResultsView."""
+        view.data = rows
+
+    @staticmethod
+    def _show_result(field, text, error, dt):
+        """Apply a worker result to its output field."""
+        if error is not None:
+            text = ''
+            App.get_running_app().notification_manager.error(error)
+        if isinstance(field, TextInput):
+            field.text = text
         else:
-            app.notification_manager.error(f"Sandhi analysis failed: {result.get('error', 'Unknown error')}")
+            _set_lines(field, text)
     
     def _on_learn_rule(self, instance):
         """Handle learn rule button press."""
-        app = App.get_running_app()
+        app = self.app
         
-        instruction = self.learn_input.text.strip()
-        if not instruction:
+        # Reject empty input before strip() copies a possibly
+        # huge buffer
+        raw = self.learn_input.text
+        if not raw or raw.isspace():
             app.notification_manager.warning("Please enter a rule description")
             return
+        instruction = raw.strip()
         
         # Add the rule
         result = app.sanskrit_nlp.learn_grammar_rule(instruction)
@@ -633,22 +560,20 @@ class SanskritScreen(Screen):
     
     def _load_existing_rules(self):
         """Load and display existing grammar rules."""
-        app = App.get_running_app()
+        app = self.app
         
         # Get existing rules
         rules = app.sanskrit_nlp.get_grammar_rules()
         
         if rules:
-            display_text = []
+            parts = []
             for rule in rules:
-                display_text.append(f"Rule {rule.get('id', '')}:")
-                display_text.append(f"  Description: {rule.get('description', '')}")
+                fields = defaultdict(str, rule)
+                parts.append(_RULE_TEMPLATE.format_map(fields))
                 if 'pattern' in rule and 'replacement' in rule:
-                    display_text.append(f"  Pattern: {rule.get('pattern', '')}")
-                    display_text.append(f"  Replacement: {rule.get('replacement', '')}")
-                display_text.append(f"  Created: {rule.get('created_at', '')}")
-                display_text.append("")
-            
-            self.rules_display.text = '\n'.join(display_text)
+                    parts.append(_RULE_PATTERN_TEMPLATE.format_map(fields))
+                parts.append(_RULE_CREATED_TEMPLATE.format_map(fields))
+
+            _set_lines(self.rules_display, ''.join(parts).rstrip('\n'))
         else:
-            self.rules_display.text = "No grammar rules have been added yet."
\ No newline at end of file
+            _set_lines(self.rules_display, "No grammar rules have been added yet.")
\ No newline at end of file
@@ -3,474 +3,408 @@ Settings Screen Module.
 This screen allows users to configure application settings.
 """
 
+from functools import partial
+
 from kivy.app import App
 from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.gridlayout import GridLayout
-from kivy.uix.scrollview import ScrollView
-from kivy.uix.label import Label
-from kivy.uix.textinput import TextInput
-from kivy.uix.button import Button
-from kivy.uix.togglebutton import ToggleButton
+from kivy.uix.anchorlayout import AnchorLayout
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.properties import StringProperty, BooleanProperty, ObjectProperty
 from kivy.metrics import dp
-from kivy.properties import StringProperty, BooleanProperty
-from kivy.logger import Logger
+from kivy.factory import Factory
+from kivy.lang import Builder
 
 from kivy_app.models.model_handler import ModelType
+# Imported for its side effect: registers the shared ScreenHeader rule
+# used in the KV template below
+from kivy_app.screens import _common
+
+# Enum members bound once at import; handlers then load one module
+# global per use instead of two attribute lookups through the enum
+_GEMMA = ModelType.GEMMA
+_CHATGPT = ModelType.CHATGPT
+_QISKIT = ModelType.QISKIT
+
+# Metric conversions computed once at import; dp() re-runs the DPI
+# multiply on every call, which adds up across a screen build
+DP_30 = dp(30)
+DP_40 = dp(40)
+DP_80 = dp(80)
+
+# Settings keys of the API-key rows and the model each one belongs to
+_API_KEY_MODELS = (
+    ('gemma_api', _GEMMA),
+    ('chatgpt_api', _CHATGPT),
+    ('qiskit_api', _QISKIT),
+)
+
+# Which ModelType a path row browses for, keyed by its settings key
+_PATH_MODELS = {
+    'gemma_path': _GEMMA,
+}
+
+# File-browser filters built once; browsing repeatedly reuses the same
+# tuples instead of allocating fresh lists per click
+_DEFAULT_FILTERS = ('*.*',)
+_FILTERS_BY_MODEL = {
+    _GEMMA: ('*.gguf', '*.bin'),
+}
+
+
+# Row templates for the virtualized settings list; compiled once at
+# import and pooled by the RecycleView, so only the visible rows exist
+# as widgets no matter how many settings the page grows
+KV = '''
+<SettingsList@RecycleView>:
+    do_scroll_x: False
+    RecycleBoxLayout:
+        orientation: 'vertical'
+        spacing: dp(10)
+        default_size: None, dp(40)
+        default_size_hint: 1, None
+        key_size: 'size'
+        key_viewclass: 'viewclass'
+        size_hint_y: None
+        height: self.minimum_height
+
+<SettingHeader@Label>:
+    font_size: dp(18)
+    bold: True
+    halign: 'left'
+    text_size: self.size
+
+<TextSettingRow>:
+    orientation: 'vertical'
+    spacing: dp(5)
+    Label:
+        text: root.label
+        size_hint: 1, None
+        height: dp(30)
+        halign: 'left'
+        text_size: self.size
+    TextInput:
+        text: root.value
+        multiline: False
+        password: root.password
+        hint_text: root.hint
+        size_hint: 1, None
+        height: dp(40)
+        on_text: root._on_edit(self.text)
+
+<PathSettingRow>:
+    orientation: 'horizontal'
+    spacing: dp(5)
+    Label:
+        text: root.label
+        size_hint: 0.3, 1
+        halign: 'left'
+        text_size: self.size
+    TextInput:
+        text: root.value
+        multiline: False
+        hint_text: root.hint
+        size_hint: 0.5, 1
+        on_text: root._on_edit(self.text)
+    Button:
+        text: 'Browse'
+        size_hint: 0.2, 1
+        on_press: root._on_browse()
+
+<ToggleSettingRow>:
+    orientation: 'horizontal'
+    Label:
+        text: root.label
+        halign: 'left'
+        valign: 'middle'
+        text_size: self.size
+    AnchorLayout:
+        anchor_x: 'right'
+        ToggleButton:
+            text: 'On' if self.state == 'down' else 'Off'
+            state: root.value
+            size_hint: None, None
+            size: dp(80), dp(40)
+            on_state: root._on_toggle(self.state)
+
+<ActionRow>:
+    anchor_x: 'center'
+    Button:
+        text: root.label
+        size_hint: 0.5, 1
+        on_press: root._fire(self)
+
+<SettingsContent@BoxLayout>:
+    orientation: 'vertical'
+    padding: dp(20)
+    spacing: dp(15)
+    ScreenHeader:
+        title: 'Settings'
+    SettingsList:
+        id: settings_view
+        size_hint: 1, 0.9
+'''
+Builder.load_string(KV)
+
+
+class TextSettingRow(RecycleDataViewBehavior, BoxLayout):
+    """Labelled text input row backed by the screen's values dict."""
+
+    key = StringProperty('')
+    label = StringProperty('')
+    hint = StringProperty('')
+    password = BooleanProperty(False)
+    value = StringProperty('')
+    screen = ObjectProperty(None)
+
+    # True while refresh_view_attrs is rehydrating the row, so the KV
+    # on_text chain it fires is not mistaken for a user edit
+    _refreshing = False
+
+    def refresh_view_attrs(self, rv, index, data):
+        # Applying the data snapshot fires on_text before the stored
+        # value is re-read below; without the guard that write-back
+        # would overwrite the user's latest edit in screen._values
+        self._refreshing = True
+        try:
+            super().refresh_view_attrs(rv, index, data)
+            # Pooled rows show the user's latest edit, not the snapshot
+            # the data list was built with
+            self.value = data['screen']._values[data['key']]
+        finally:
+            self._refreshing = False
+
+    def _on_edit(self, text):
+        if self._refreshing:
+            return
+        # Keep the property in step with the input so a recycled row
+        # dispatches a change even when the next value matches the old
+        # property value
+        self.value = text
+        if self.screen is not None:
+            self.screen._values[self.key] = text
+
+
+class PathSettingRow(TextSettingRow):
+    """Text input row with a Browse button for picking a file path."""
+
+    def _on_browse(self):
+        self.screen._browse_for_model_path(_PATH_MODELS[self.key])
+
+
+class ToggleSettingRow(RecycleDataViewBehavior, BoxLayout):
+    """On/off toggle row backed by the screen's values dict."""
+
+    key = StringProperty('')
+    label = StringProperty('')
+    value = StringProperty('normal')
+    screen = ObjectProperty(None)
+
+    # True while refresh_view_attrs is rehydrating the row; see
+    # TextSettingRow
+    _refreshing = False
+
+    def refresh_view_attrs(self, rv, index, data):
+        self._refreshing = True
+        try:
+            super().refresh_view_attrs(rv, index, data)
+            self.value = data['screen']._values[data['key']]
+        finally:
+            self._refreshing = False
+
+    def _on_toggle(self, state):
+        if self._refreshing:
+            return
+        self.value = state
+        if self.screen is not None:
+            self.screen._values[self.key] = state
+            self.screen._on_setting_toggled(self.key, state)
+
+
+class ActionRow(RecycleDataViewBehavior, AnchorLayout):
+    """Centered button row dispatching to a screen handler by name."""
+
+    label = StringProperty('')
+    action = StringProperty('')
+    screen = ObjectProperty(None)
+
+    def _fire(self, instance):
+        getattr(self.screen, self.action)(instance)
+
 
 class SettingsScreen(Screen):
     """Settings screen for configuring the application."""
-    
+
+    # App and model-handler references cached on first entry so
+    # handlers skip the registry lookup and attribute walk per press
+    app = None
+    _model_handler = None
+
     def on_enter(self, *args):
         """Actions to perform when screen is entered."""
+        if self.app is None:
+            self.app = App.get_running_app()
+            self._model_handler = self.app.model_handler
+
         # Create content if not already created
         if not self.children:
             self.create_content()
-    
+
     def create_content(self):
-        """Create the screen content."""
-        # Main layout
-        main_layout = BoxLayout(
-            orientation='vertical',
-            padding=dp(20),
-            spacing=dp(15)
-        )
-        
-        # Header with back button
-        header = BoxLayout(
-            size_hint=(1, 0.1),
-            spacing=dp(10)
-        )
-        
-        back_button = Button(
-            text='Back',
-            size_hint=(0.2, 1),
-            background_normal='',
-            background_color=(0.3, 0.3, 0.3, 1)
-        )
-        back_button.bind(on_press=self._on_back_pressed)
-        
-        title = Label(
-            text='Settings',
-            font_size=dp(24),
-            bold=True,
-            size_hint=(0.8, 1)
-        )
-        
-        header.add_widget(back_button)
-        header.add_widget(title)
-        
-        # Content in a scrollview
-        scroll_view = ScrollView(
-            size_hint=(1, 0.9),
-            do_scroll_x=False
-        )
-        
-        settings_layout = BoxLayout(
-            orientation='vertical',
-            spacing=dp(20),
-            size_hint=(1, None)
-        )
-        settings_layout.bind(minimum_height=settings_layout.setter('height'))
-        
-        # Sections
-        api_keys_section = self._create_api_keys_section()
-        model_paths_section = self._create_model_paths_section()
-        app_settings_section = self._create_app_settings_section()
-        
-        # Add sections
-        settings_layout.add_widget(api_keys_section)
-        settings_layout.add_widget(model_paths_section)
-        settings_layout.add_widget(app_settings_section)
-        
-        # Add the settings layout to the scroll view
-        scroll_view.add_widget(settings_layout)
-        
-        # Add widgets to main layout
-        main_layout.add_widget(header)
-        main_layout.add_widget(scroll_view)
-        
+        """Create the screen content from the KV template."""
+        content = Factory.SettingsContent()
+
+        # The whole settings page is one virtualized list: the row
+        # builders below produce plain dicts and the RecycleView keeps
+        # only the visible rows alive as widgets
+        settings_view = content.ids.settings_view
+        settings_view.data = self._build_rows()
+        self.settings_view = settings_view
+
         # Add to screen
-        self.add_widget(main_layout)
-    
-    def _create_api_keys_section(self):
-        """Create the API keys settings section."""
-        app = App.get_running_app()
-        
-        section = BoxLayout(
-            orientation='vertical',
-            spacing=dp(10),
-            size_hint=(1, None),
-            height=dp(300)
-        )
-        
-        # Section header
-        header = Label(
-            text='API Keys',
-            font_size=dp(18),
-            bold=True,
-            size_hint=(1, None),
-            height=dp(30),
-            halign='left'
-        )
-        header.bind(size=header.setter('text_size'))
-        
-        # Gemma API key
-        gemma_layout = BoxLayout(
-            orientation='vertical',
-            spacing=dp(5),
-            size_hint=(1, None),
-            height=dp(80)
-        )
-        
-        gemma_label = Label(
-            text='Gemma API Key',
-            size_hint=(1, None),
-            height=dp(30),
-            halign='left'
-        )
-        
-        gemma_input = TextInput(
-            text=app.model_handler.get_api_key(ModelType.GEMMA),
-            multiline=False,
-            password=True,
-            hint_text='Enter Gemma API key',
-            size_hint=(1, None),
-            height=dp(40)
-        )
-        
-        gemma_layout.add_widget(gemma_label)
-        gemma_layout.add_widget(gemma_input)
-        
-        # ChatGPT API key
-        chatgpt_layout = BoxLayout(
-            orientation='vertical',
-            spacing=dp(5),
-            size_hint=(1, None),
-            height=dp(80)
-        )
-        
-        chatgpt_label = Label(
-            text='ChatGPT API Key',
-            size_hint=(1, None),
-            height=dp(30),
-            halign='left'
-        )
-        
-        chatgpt_input = TextInput(
-            text=app.model_handler.get_api_key(ModelType.CHATGPT),
-            multiline=False,
-            password=True,
-            hint_text='Enter ChatGPT API key',
-            size_hint=(1, None),
-            height=dp(40)
-        )
-        
-        chatgpt_layout.add_widget(chatgpt_label)
-        chatgpt_layout.add_widget(chatgpt_input)
-        
-        # Qiskit API key
-        qiskit_layout = BoxLayout(
-            orientation='vertical',
-            spacing=dp(5),
-            size_hint=(1, None),
-            height=dp(80)
-        )
-        
-        qiskit_label = Label(
-            text='IBM Quantum API Key',
-            size_hint=(1, None),
-            height=dp(30),
-            halign='left'
-        )
-        
-        qiskit_input = TextInput(
-            text=app.model_handler.get_api_key(ModelType.QISKIT),
-            multiline=False,
-            password=True,
-            hint_text='Enter IBM Quantum API key',
-            size_hint=(1, None),
-            height=dp(40)
-        )
-        
-        qiskit_layout.add_widget(qiskit_label)
-        qiskit_layout.add_widget(qiskit_input)
-        
-        # Save button
-        save_api_keys_button = Button(
-            text='Save API Keys',
-            size_hint=(0.5, None),
-            height=dp(40),
-            pos_hint={'center_x': 0.5}
-        )
-        
-        # Store references to inputs
-        self.gemma_api_key_input = gemma_input
-        self.chatgpt_api_key_input = chatgpt_input
-        self.qiskit_api_key_input = qiskit_input
-        
-        # Bind save button
-        save_api_keys_button.bind(on_press=self._on_save_api_keys)
-        
-        # Add widgets to section
-        section.add_widget(header)
-        section.add_widget(gemma_layout)
-        section.add_widget(chatgpt_layout)
-        section.add_widget(qiskit_layout)
-        section.add_widget(save_api_keys_button)
-        
-        return section
-    
-    def _create_model_paths_section(self):
-        """Create the model paths settings section."""
-        app = App.get_running_app()
-        
-        section = BoxLayout(
-            orientation='vertical',
-            spacing=dp(10),
-            size_hint=(1, None),
-            height=dp(200)
-        )
-        
-        # Section header
-        header = Label(
-            text='Local Model Paths',
-            font_size=dp(18),
-            bold=True,
-            size_hint=(1, None),
-            height=dp(30),
-            halign='left'
-        )
-        header.bind(size=header.setter('text_size'))
-        
-        # Gemma model path
-        gemma_path_layout = BoxLayout(
-            orientation='horizontal',
-            spacing=dp(5),
-            size_hint=(1, None),
-            height=dp(40)
-        )
-        
-        gemma_path_label = Label(
-            text='Gemma Model Path:',
-            size_hint=(0.3, 1),
-            halign='left'
-        )
-        
-        gemma_path_input = TextInput(
-            text=app.model_handler.get_model_path(ModelType.GEMMA),
-            multiline=False,
-            hint_text='Path to local Gemma model',
-            size_hint=(0.5, 1)
-        )
-        
-        gemma_path_button = Button(
-            text='Browse',
-            size_hint=(0.2, 1)
-        )
-        
-        gemma_path_layout.add_widget(gemma_path_label)
-        gemma_path_layout.add_widget(gemma_path_input)
-        gemma_path_layout.add_widget(gemma_path_button)
-        
-        # Save button
-        save_paths_button = Button(
-            text='Save Paths',
-            size_hint=(0.5, None),
-            height=dp(40),
-            pos_hint={'center_x': 0.5}
-        )
-        
-        # Store references to inputs
-        self.gemma_path_input = gemma_path_input
-        
-        # Bind buttons
-        gemma_path_button.bind(on_press=lambda x: self._browse_for_model_path(ModelType.GEMMA))
-        save_paths_button.bind(on_press=self._on_save_model_paths)
-        
-        # Add widgets to section
-        section.add_widget(header)
-        section.add_widget(gemma_path_layout)
-        section.add_widget(save_paths_button)
-        
-        return section
-    
-    def _create_app_settings_section(self):
-        """Create the application settings section."""
-        section = BoxLayout(
-            orientation='vertical',
-            spacing=dp(10),
-            size_hint=(1, None),
-            height=dp(250)
-        )
-        
-        # Section header
-        header = Label(
-            text='Application Settings',
-            font_size=dp(18),
-            bold=True,
-            size_hint=(1, None),
-            height=dp(30),
-            halign='left'
-        )
-        header.bind(size=header.setter('text_size'))
-        
-        # Settings grid
-        settings_grid = GridLayout(
-            cols=2,
-            spacing=dp(10),
-            size_hint=(1, None),
-            height=dp(150)
-        )
-        
-        # Dark mode setting
-        dark_mode_label = Label(
-            text='Dark Mode',
-            halign='left',
-            valign='middle'
-        )
-        dark_mode_label.bind(size=dark_mode_label.setter('text_size'))
-        
-        dark_mode_toggle = ToggleButton(
-            text='Off',
-            size_hint=(None, None),
-            size=(dp(80), dp(40)),
-            pos_hint={'center_y': 0.5}
-        )
-        dark_mode_toggle.bind(state=self._on_dark_mode_toggle)
-        
-        # Auto-save setting
-        auto_save_label = Label(
-            text='Auto-save',
-            halign='left',
-            valign='middle'
-        )
-        auto_save_label.bind(size=auto_save_label.setter('text_size'))
-        
-        auto_save_toggle = ToggleButton(
-            text='Off',
-            size_hint=(None, None),
-            size=(dp(80), dp(40)),
-            pos_hint={'center_y': 0.5}
-        )
-        auto_save_toggle.bind(state=self._on_auto_save_toggle)
-        
-        # Add to grid
-        settings_grid.add_widget(dark_mode_label)
-        settings_grid.add_widget(dark_mode_toggle)
-        settings_grid.add_widget(auto_save_label)
-        settings_grid.add_widget(auto_save_toggle)
-        
-        # Reset settings button
-        reset_button = Button(
-            text='Reset to Defaults',
-            size_hint=(0.5, None),
-            height=dp(40),
-            pos_hint={'center_x': 0.5}
-        )
-        reset_button.bind(on_press=self._on_reset_settings)
-        
-        # Add widgets to section
-        section.add_widget(header)
-        section.add_widget(settings_grid)
-        section.add_widget(reset_button)
-        
-        return section
-    
-    def _on_back_pressed(self, instance):
-        """Handle back button press."""
-        app = App.get_running_app()
-        app.navigate_to('home')
-    
+        self.add_widget(content)
+
+    def _build_rows(self):
+        """Build the row-data list driving the settings view."""
+        model_handler = self._model_handler
+
+        # Current values, keyed by setting; edited rows write back here
+        # so recycled widgets always rehydrate from one source of truth
+        self._values = {
+            'gemma_api': model_handler.get_api_key(_GEMMA),
+            'chatgpt_api': model_handler.get_api_key(_CHATGPT),
+            'qiskit_api': model_handler.get_api_key(_QISKIT),
+            'gemma_path': model_handler.get_model_path(_GEMMA),
+            'dark_mode': 'normal',
+            'auto_save': 'normal',
+        }
+
+        return (self._api_keys_rows()
+                + self._model_paths_rows()
+                + self._app_settings_rows())
+
+    def _header_row(self, text):
+        """Row dict for a bold section header."""
+        return {'viewclass': 'SettingHeader', 'text': text,
+                'size': (0, DP_30)}
+
+    def _text_row(self, key, label, hint, password=False):
+        """Row dict for a labelled text input."""
+        return {'viewclass': 'TextSettingRow', 'screen': self, 'key': key,
+                'label': label, 'hint': hint, 'password': password,
+                'value': self._values[key], 'size': (0, DP_80)}
+
+    def _action_row(self, label, action):
+        """Row dict for a centered action button."""
+        return {'viewclass': 'ActionRow', 'screen': self, 'label': label,
+                'action': action, 'size': (0, DP_40)}
+
+    def _api_keys_rows(self):
+        """Row data for the API keys section."""
+        return [
+            self._header_row('API Keys'),
+            self._text_row('gemma_api', 'Gemma API Key',
+                           'Enter Gemma API key', password=True),
+            self._text_row('chatgpt_api', 'ChatGPT API Key',
+                           'Enter ChatGPT API key', password=True),
+            self._text_row('qiskit_api', 'IBM Quantum API Key',
+                           'Enter IBM Quantum API key', password=True),
+            self._action_row('Save API Keys', '_on_save_api_keys'),
+        ]
+
+    def _model_paths_rows(self):
+        """Row data for the model paths section."""
+        return [
+            self._header_row('Local Model Paths'),
+            {'viewclass': 'PathSettingRow', 'screen': self,
+             'key': 'gemma_path', 'label': 'Gemma Model Path:',
+             'hint': 'Path to local Gemma model', 'password': False,
+             'value': self._values['gemma_path'], 'size': (0, DP_40)},
+            self._action_row('Save Paths', '_on_save_model_paths'),
+        ]
+
+    def _app_settings_rows(self):
+        """Row data for the application settings section."""
+        return [
+            self._header_row('Application Settings'),
+            {'viewclass': 'ToggleSettingRow', 'screen': self,
+             'key': 'dark_mode', 'label': 'Dark Mode',
+             'value': self._values['dark_mode'], 'size': (0, DP_40)},
+            {'viewclass': 'ToggleSettingRow', 'screen': self,
+             'key': 'auto_save', 'label': 'Auto-save',
+             'value': self._values['auto_save'], 'size': (0, DP_40)},
+            self._action_row('Reset to Defaults', '_on_reset_settings'),
+        ]
+
     def _on_save_api_keys(self, instance):
         """Handle save API keys button press."""
-        app = App.get_running_app()
-        
-        # Get input values
-        gemma_api_key = self.gemma_api_key_input.text.strip()
-        chatgpt_api_key = self.chatgpt_api_key_input.text.strip()
-        qiskit_api_key = self.qiskit_api_key_input.text.strip()
-        
-        # Update API keys
-        app.model_handler.set_api_key(ModelType.GEMMA, gemma_api_key)
-        app.model_handler.set_api_key(ModelType.CHATGPT, chatgpt_api_key)
-        app.model_handler.set_api_key(ModelType.QISKIT, qiskit_api_key)
-        
+        model_handler = self._model_handler
+
+        # Only push keys the user actually changed; an untouched save is
+        # then a no-op with no config write at all
+        changed = {}
+        for key, model in _API_KEY_MODELS:
+            value = self._values[key].strip()
+            if value != model_handler.get_api_key(model):
+                changed[model] = value
+
+        model_handler.set_api_keys(changed)
+
         # Show success notification
-        app.notification_manager.success("API keys saved successfully")
-    
+        self.app.notification_manager.success("API keys saved successfully")
+
     def _on_save_model_paths(self, instance):
         """Handle save model paths button press."""
-        app = App.get_running_app()
-        
-        # Get input values
-        gemma_path = self.gemma_path_input.text.strip()
-        
         # Update paths
-        app.model_handler.set_model_path(ModelType.GEMMA, gemma_path)
-        
+        self._model_handler.set_model_path(
+            _GEMMA, self._values['gemma_path'].strip())
+
         # Show success notification
-        app.notification_manager.success("Model paths saved successfully")
-    
+        self.app.notification_manager.success("Model paths saved successfully")
+
     def _browse_for_model_path(self, model_type):
         """
         Open file browser to select model path.
-        
+
         Args:
             model_type (ModelType): The model type to set path for
         """
-        app = App.get_running_app()
-        
-        # File filters based on model type
-        if model_type == ModelType.GEMMA:
-            filters = ['*.gguf', '*.bin']
-        else:
-            filters = ['*.*']
-        
-        # Show file selector
-        app.file_manager.select_file(
+        # Show file selector; partial avoids building a fresh closure
+        # over self and model_type on every browse. The saved path is
+        # replayed across runs, so a document-picker copy must live in
+        # durable storage, not the reaped temp dir
+        self.app.file_manager.select_file(
             title=f"Select {model_type.value} model file",
-            filters=filters,
-            on_selection=lambda path: self._on_model_path_selected(model_type, path)
+            filters=_FILTERS_BY_MODEL.get(model_type, _DEFAULT_FILTERS),
+            on_selection=partial(self._on_model_path_selected, model_type),
+            persist=True
         )
-    
+
     def _on_model_path_selected(self, model_type, path):
         """
         Handle model path selection.
-        
+
         Args:
             model_type (ModelType): The model type to set path for
             path (str): Selected file path
         """
-        app = App.get_running_app()
-        
-        # Update path input
-        if model_type == ModelType.GEMMA:
-            self.gemma_path_input.text = path
-        
-        app.notification_manager.info(f"Selected {model_type.value} model: {path}")
-    
-    def _on_dark_mode_toggle(self, instance, value):
-        """Handle dark mode toggle."""
-        # Update toggle button text
-        instance.text = 'On' if value == 'down' else 'Off'
-        
-        # TODO: Implement dark mode theme switching
-        # This would change the app's color scheme
-    
-    def _on_auto_save_toggle(self, instance, value):
-        """Handle auto-save toggle."""
-        # Update toggle button text
-        instance.text = 'On' if value == 'down' else 'Off'
-        
-        # TODO: Implement auto-save setting
-    
+        # Update path value and rehydrate any visible row showing it
+        if model_type == _GEMMA:
+            self._values['gemma_path'] = path
+            self.settings_view.refresh_from_data()
+
+        self.app.notification_manager.info(f"Selected {model_type.value} model: {path}")
+
+    def _on_setting_toggled(self, key, state):
+        """Handle an application-setting toggle changing state."""
+        # TODO: Implement dark mode theme switching and the auto-save
+        # setting; for now the state only lives in self._values
+        pass
+
     def _on_reset_settings(self, instance):
         """Handle reset settings button press."""
-        app = App.get_running_app()
-        
         # Reset settings (placeholder)
         # This would reset all settings to default values
-        
+
         # For now, just show notification
-        app.notification_manager.info("Settings reset to defaults")
\ No newline at end of file
+        self.app.notification_manager.info("Settings reset to defaults")
@@ -3,11 +3,15 @@ File Manager Module.
 This module is responsible for handling file operations such as opening, saving, and browsing files.
 """
 
+import fnmatch
 import os
+import re
 import tempfile
 import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Callable, List, Optional, Union
+from typing import Callable, Iterable, List, Optional, Tuple, Union
 
 from kivy.app import App
 from kivy.uix.boxlayout import BoxLayout
@@ -16,7 +20,13 @@ from kivy.uix.filechooser import FileChooserListView, FileChooserIconView
 from kivy.uix.popup import Popup
 from kivy.uix.label import Label
 from kivy.metrics import dp
+from kivy.clock import Clock
 from kivy.logger import Logger
+from kivy.utils import platform
+
+# Request code identifying our Storage Access Framework picker in the
+# activity-result stream
+_SAF_REQUEST_CODE = 0xF11E
 
 
 class FileManager:
@@ -26,6 +36,29 @@ class FileManager:
         """Initialize the file manager."""
         self.default_dir = self._get_default_directory()
         self.temp_dir = self._get_temp_directory()
+
+        # Compiled filename matchers keyed by filter tuple; repeated
+        # browses with the same filters reuse the same regex
+        self._filter_cache = {}
+
+        # Worker pool for the *_async entry points; slow SD-card IO
+        # then never runs on Kivy's main thread, where it would freeze
+        # frame scheduling
+        self._io = ThreadPoolExecutor(max_workers=2, thread_name_prefix='elai-io')
+
+        # Shared scratch append log, opened lazily on first use; the
+        # lock keeps concurrent appends from the IO pool ordered
+        self._scratch_fd = None
+        self._scratch_path = None
+        self._scratch_lock = threading.Lock()
+
+        # Reusable selection dialog, built lazily on first browse
+        self._popup = None
+        self._file_chooser = None
+        self._chooser_slot = None
+        self._title_label = None
+        self._select_btn = None
+        self._pending_callback = None
         
         # Create temp directory if it doesn't exist
         if not os.path.exists(self.temp_dir):
@@ -70,7 +103,8 @@ class FileManager:
                    filters: List[str] = None, 
                    initial_path: str = None,
                    on_selection: Callable[[Optional[str]], None] = None,
-                   mode: str = 'open') -> None:
+                   mode: str = 'open',
+                   persist: bool = False) -> None:
         """
         Open a file selection dialog.
         
@@ -80,40 +114,249 @@ class FileManager:
             initial_path (str): Initial directory to open
             on_selection (Callable): Callback function to call with selected file path
             mode (str): 'open' or 'save'
+            persist (bool): On Android, copy the picked document into
+                durable app storage instead of the temp dir; set this
+                when the selected path is saved and reused across runs
         """
         if not initial_path:
             initial_path = self.default_dir
-        
-        # Create file chooser dialog
+
+        # On Android, hand off to the OS document picker: the system UI
+        # is virtualized and opens in constant time, where the in-app
+        # chooser below builds a widget per directory entry up front
+        if platform == 'android' and mode == 'open':
+            if self._select_file_android(on_selection, persist):
+                return
+
+        # The dialog is built once and reused: later opens only reset
+        # its title, path, and filters instead of rebuilding the popup,
+        # buttons, and chooser tree per browse
+        self._pending_callback = on_selection
+
+        # One compiled alternation regex replaces an O(patterns) fnmatch
+        # walk per filename during the directory scan
+        chooser_filters = [self._compiled_filter(filters)] if filters else []
+
+        if self._popup is None:
+            self._build_selector()
+
+        self._popup.title = title
+        self._title_label.text = title
+        self._select_btn.text = 'Select' if mode == 'open' else 'Save'
+
+        def configure_chooser(dt):
+            # The chooser is created one frame after the popup first
+            # appears, so the initial directory scan happens behind a
+            # visible dialog instead of stalling the tap that opened it
+            chooser = self._file_chooser
+            if chooser is None:
+                chooser = FileChooserListView()
+                chooser.bind(on_submit=self._on_chooser_submit)
+                self._chooser_slot.add_widget(chooser)
+                self._file_chooser = chooser
+
+            chooser.dirselect = (mode == 'dir')
+            chooser.filters = chooser_filters
+            chooser.selection = []
+            chooser.path = initial_path
+
+        self._popup.open()
+        Clock.schedule_once(configure_chooser, 0)
+    
+    def _submit(self, fn, callback, *args) -> Future:
+        """
+        Run a file operation on the IO pool.
+
+        Args:
+            fn (Callable): The synchronous method to run
+            callback (Callable): Called on the main thread with the
+                result, or None to fire and forget
+            *args: Arguments forwarded to fn
+
+        Returns:
+            Future: The pending operation
+        """
+        future = self._io.submit(fn, *args)
+        if callback is not None:
+            # Hop back to the UI thread before touching widgets
+            future.add_done_callback(
+                lambda fut: Clock.schedule_once(lambda dt: callback(fut.result()), 0))
+        return future
+
+    def read_file_async(self, filepath: str,
+                        callback: Callable[[Optional[str]], None]) -> Future:
+        """Read a file off the UI thread; see read_file."""
+        return self._submit(self.read_file, callback, filepath)
+
+    def save_file_async(self, filepath: str, content: Union[str, Iterable[str]],
+                        callback: Callable[[bool], None] = None) -> Future:
+        """Save a file off the UI thread; see save_file."""
+        return self._submit(self.save_file, callback, filepath, content)
+
+    def copy_file_async(self, src: str, dst: str,
+                        callback: Callable[[bool], None] = None) -> Future:
+        """Copy a file off the UI thread; see copy_file."""
+        return self._submit(self.copy_file, callback, src, dst)
+
+    def create_temp_file_async(self, content: str, prefix: str = "temp_",
+                               suffix: str = ".txt",
+                               callback: Callable[[Optional[str]], None] = None) -> Future:
+        """Create a temp file off the UI thread; see create_temp_file."""
+        return self._submit(self.create_temp_file, callback, content, prefix, suffix)
+
+    def clean_temp_files_async(self, days_old: int = 7,
+                               callback: Callable[[int], None] = None) -> Future:
+        """Clean old temp files off the UI thread; see clean_temp_files."""
+        return self._submit(self.clean_temp_files, callback, days_old)
+
+    def _compiled_filter(self, filters: List[str]) -> Callable[[str, str], bool]:
+        """
+        Merge glob patterns into one cached callable filename filter.
+
+        Args:
+            filters (List[str]): Glob patterns (e.g., ['*.gguf', '*.bin'])
+
+        Returns:
+            Callable: Filter accepted by FileChooser, matching a name
+                against all patterns with a single compiled regex
+        """
+        key = tuple(filters)
+        matcher = self._filter_cache.get(key)
+        if matcher is None:
+            combined = re.compile('|'.join(fnmatch.translate(p) for p in key))
+
+            def matcher(folder, name, _match=combined.match):
+                return _match(name) is not None
+
+            self._filter_cache[key] = matcher
+        return matcher
+
+    def _select_file_android(self, on_selection: Callable[[Optional[str]], None],
+                             persist: bool = False) -> bool:
+        """
+        Launch the Android Storage Access Framework document picker.
+
+        Args:
+            on_selection (Callable): Callback to call with the selected
+                file path, or None if the picker was cancelled
+            persist (bool): Copy the picked document into durable app
+                storage instead of the temp dir
+
+        Returns:
+            bool: True if the picker was launched, False to fall back
+                to the in-app chooser
+        """
+        try:
+            from android import activity, mActivity
+            from jnius import autoclass
+        except (ImportError, Exception):
+            return False
+
+        # Paths that outlive the session must not land in the temp
+        # dir, where clean_temp_files reaps them after a week
+        if persist:
+            dest_dir = os.path.join(self.get_app_dir(), 'imported')
+        else:
+            dest_dir = self.temp_dir
+
+        try:
+            Intent = autoclass('android.content.Intent')
+            intent = Intent(Intent.ACTION_OPEN_DOCUMENT)
+            intent.addCategory(Intent.CATEGORY_OPENABLE)
+            intent.setType('*/*')
+
+            def on_activity_result(request_code, result_code, data):
+                if request_code != _SAF_REQUEST_CODE:
+                    return
+                activity.unbind(on_activity_result=on_activity_result)
+
+                path = None
+                if result_code == -1 and data is not None:  # RESULT_OK
+                    path = self._copy_uri_to_dir(data.getData(), dest_dir)
+                if on_selection:
+                    on_selection(path)
+
+            activity.bind(on_activity_result=on_activity_result)
+            mActivity.startActivityForResult(intent, _SAF_REQUEST_CODE)
+            return True
+        except Exception as e:
+            Logger.error(f"FileManager: SAF picker failed, falling back: {e}")
+            return False
+
+    def _copy_uri_to_dir(self, uri, dest_dir: str) -> Optional[str]:
+        """
+        Copy a content:// document into a directory so callers get a
+        plain filesystem path.
+
+        Args:
+            uri: Android Uri returned by the document picker
+            dest_dir (str): Directory to copy the document into
+
+        Returns:
+            str: Path to the copied file or None if the copy failed
+        """
+        try:
+            from android import mActivity
+            from jnius import autoclass
+
+            resolver = mActivity.getContentResolver()
+            stream = resolver.openInputStream(uri)
+
+            os.makedirs(dest_dir, exist_ok=True)
+            name = os.path.basename(uri.getLastPathSegment() or 'document')
+            filepath = os.path.join(dest_dir, name)
+
+            # FileUtils.copy loops kernel-side instead of shuttling the
+            # bytes through Python one buffer at a time
+            FileUtils = autoclass('android.os.FileUtils')
+            FileOutputStream = autoclass('java.io.FileOutputStream')
+            out = FileOutputStream(filepath)
+            FileUtils.copy(stream, out)
+            out.close()
+            stream.close()
+
+            return filepath
+        except Exception as e:
+            Logger.error(f"FileManager: Failed to copy picked document: {e}")
+            return None
+
+    def _build_selector(self) -> None:
+        """Build the reusable file-selection popup (first browse only)."""
         content = BoxLayout(orientation='vertical', spacing=dp(10), padding=dp(10))
-        
-        file_chooser = FileChooserListView(
-            path=initial_path,
-            filters=filters,
-            dirselect=(mode == 'dir')
-        )
-        
+
+        self._title_label = Label(text='', size_hint_y=None, height=dp(30))
+        self._chooser_slot = BoxLayout()
+
         buttons = BoxLayout(size_hint_y=None, height=dp(50), spacing=dp(10))
-        
+
         cancel_btn = Button(text='Cancel')
-        select_btn = Button(text='Select' if mode == 'open' else 'Save')
-        
-        # Bind events
-        file_chooser.bind(on_submit=lambda instance, selection, touch: self._on_file_selected(selection[0], on_selection) if selection else None)
-        cancel_btn.bind(on_release=lambda instance: popup.dismiss())
-        select_btn.bind(on_release=lambda instance: self._on_file_selected(file_chooser.selection[0], on_selection, popup) if file_chooser.selection else None)
-        
+        self._select_btn = Button(text='Select')
+
+        cancel_btn.bind(on_release=lambda instance: self._popup.dismiss())
+        self._select_btn.bind(on_release=self._on_select_pressed)
+
         buttons.add_widget(cancel_btn)
-        buttons.add_widget(select_btn)
-        
-        content.add_widget(Label(text=title, size_hint_y=None, height=dp(30)))
-        content.add_widget(file_chooser)
+        buttons.add_widget(self._select_btn)
+
+        content.add_widget(self._title_label)
+        content.add_widget(self._chooser_slot)
         content.add_widget(buttons)
-        
-        # Create and open popup
-        popup = Popup(title=title, content=content, size_hint=(0.9, 0.9))
-        popup.open()
-    
+
+        self._popup = Popup(title='', content=content, size_hint=(0.9, 0.9))
+
+    def _on_select_pressed(self, instance) -> None:
+        """Confirm the chooser's current selection."""
+        chooser = self._file_chooser
+        if chooser is not None and chooser.selection:
+            self._on_file_selected(
+                chooser.selection[0], self._pending_callback, self._popup)
+
+    def _on_chooser_submit(self, instance, selection, touch) -> None:
+        """Handle a double-tap/enter submit inside the chooser."""
+        if selection:
+            self._on_file_selected(
+                selection[0], self._pending_callback, self._popup)
+
     def _on_file_selected(self, path: str, callback: Callable[[str], None], popup: Popup = None) -> None:
         """
         Handle file selection.
@@ -158,6 +401,57 @@ class FileManager:
             Logger.error(f"FileManager: Failed to create temp file: {e}")
             return None
     
+    def append_scratch(self, content: str) -> Optional[Tuple[str, int, int]]:
+        """
+        Append small scratch content to a shared log file.
+
+        create_temp_file pays for a fresh inode (open, chmod, close)
+        per call; small prompt/response scraps instead share one
+        pre-opened append log and are addressed by byte offset.
+
+        Args:
+            content (str): Content to append
+
+        Returns:
+            Tuple[str, int, int]: (path, offset, length) of the written
+                slice, or None if the write failed
+        """
+        try:
+            data = content.encode('utf-8')
+            with self._scratch_lock:
+                if self._scratch_fd is None:
+                    self._scratch_fd, self._scratch_path = tempfile.mkstemp(
+                        dir=self.temp_dir, prefix='scratch_', suffix='.log')
+                offset = os.lseek(self._scratch_fd, 0, os.SEEK_END)
+                os.write(self._scratch_fd, data)
+            return self._scratch_path, offset, len(data)
+        except Exception as e:
+            Logger.error(f"FileManager: Failed to append scratch content: {e}")
+            return None
+
+    def read_scratch(self, offset: int, length: int) -> Optional[str]:
+        """
+        Read back a slice previously returned by append_scratch.
+
+        Args:
+            offset (int): Byte offset of the slice
+            length (int): Byte length of the slice
+
+        Returns:
+            str: The decoded slice, or None if unavailable
+        """
+        try:
+            with self._scratch_lock:
+                if self._scratch_fd is None:
+                    return None
+                # pread needs no seek, so readers never disturb the
+                # append position
+                data = os.pread(self._scratch_fd, length, offset)
+            return data.decode('utf-8')
+        except Exception as e:
+            Logger.error(f"FileManager: Failed to read scratch content: {e}")
+            return None
+
     def read_file(self, filepath: str) -> Optional[str]:
         """
         Read and return the content of a file.
@@ -175,13 +469,36 @@ class FileManager:
             Logger.error(f"FileManager: Failed to read file {filepath}: {e}")
             return None
     
-    def save_file(self, filepath: str, content: str) -> bool:
+    def iter_file(self, filepath: str, chunk_size: int = 65536):
+        """
+        Iterate over a file's content in binary chunks.
+
+        Streaming keeps peak memory at O(chunk) instead of loading and
+        decoding the whole file at once, which matters for large model
+        files on mobile.
+
+        Args:
+            filepath (str): Path to the file to read
+            chunk_size (int): Number of bytes per chunk
+
+        Yields:
+            bytes: Consecutive chunks of the file
+        """
+        try:
+            with open(filepath, 'rb') as f:
+                yield from iter(lambda: f.read(chunk_size), b'')
+        except Exception as e:
+            Logger.error(f"FileManager: Failed to read file {filepath}: {e}")
+
+    def save_file(self, filepath: str, content: Union[str, Iterable[str]]) -> bool:
         """
         Save content to a file.
         
         Args:
             filepath (str): Path to save the file
-            content (str): Content to write to the file
+            content (Union[str, Iterable[str]]): Content to write; an
+                iterable of strings is streamed out without being
+                joined into one large buffer first
             
         Returns:
             bool: True if successful, False otherwise
@@ -194,13 +511,38 @@ class FileManager:
                 
             # Write content to file
             with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+                if isinstance(content, str):
+                    f.write(content)
+                else:
+                    f.writelines(content)
                 
             return True
         except Exception as e:
             Logger.error(f"FileManager: Failed to save file {filepath}: {e}")
             return False
     
+    def copy_file(self, src: str, dst: str) -> bool:
+        """
+        Copy a file and preserve its metadata.
+
+        Args:
+            src (str): Path of the file to copy
+            dst (str): Destination path
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            # copyfile takes the kernel zero-copy (sendfile) path where
+            # available; copystat afterwards keeps copy2's metadata
+            # behaviour without its extra stat inside the copy loop
+            shutil.copyfile(src, dst)
+            shutil.copystat(src, dst)
+            return True
+        except Exception as e:
+            Logger.error(f"FileManager: Failed to copy {src} to {dst}: {e}")
+            return False
+
     def list_directory(self, dirpath: str, filter_pattern: str = None) -> List[str]:
         """
         List files in a directory, optionally filtered by a pattern.
@@ -22,6 +22,8 @@ from kivy.uix.floatlayout import FloatLayout
 from kivy.uix.label import Label
 from kivy.logger import Logger
 
+from kivy_app.utils.ui import sync_text_size
+
 
 class Notification(BoxLayout):
     """A notification widget that can be used to display messages to the user."""
@@ -66,7 +68,7 @@ class Notification(BoxLayout):
             shorten=True,
             markup=True
         )
-        self.message_label.bind(size=self.message_label.setter('text_size'))
+        self.message_label.bind(size=sync_text_size)
         
         # Close button (if dismissable)
         if self.dismissable:
@@ -134,32 +134,32 @@ class SanskritNLP:
             ' ': ' ', '।': '.', ',': ',', '\n': '\n'
         })
         
-        result = ""
-        
+        # Accumulate into a list and join once; += on a str reallocates
+        # and copies the whole result every iteration
+        pieces = []
+
         if to_script == 'devanagari':
             # Latin to Devanagari
             i = 0
             while i < len(text):
                 # Check for two-character matches first
                 if i < len(text) - 1 and text[i:i+2] in iast_to_devanagari:
-                    # Get the Devanagari equivalent
-                    devanagari_char = iast_to_devanagari[text[i:i+2]]
-                    # Add to result
-                    result += devanagari_char
+                    # Add the Devanagari equivalent
+                    pieces.append(iast_to_devanagari[text[i:i+2]])
                     # Skip the next character as it's part of the current mapping
                     i += 2
                 # Then check for single-character matches
                 elif text[i] in iast_to_devanagari:
-                    # Get the Devanagari equivalent
-                    devanagari_char = iast_to_devanagari[text[i]]
-                    # Add to result
-                    result += devanagari_char
+                    # Add the Devanagari equivalent
+                    pieces.append(iast_to_devanagari[text[i]])
                     i += 1
                 else:
                     # Character not in mapping, just add it as is
-                    result += text[i]
+                    pieces.append(text[i])
                     i += 1
-            
+
+            result = ''.join(pieces)
+
             # Process the result for correct Devanagari rendering
             # Replace implicit 'a' vowels
             result = result.replace('्अ', '')
@@ -178,12 +178,8 @@ class SanskritNLP:
         else:
             # Devanagari to Latin
             # This is a simplified conversion that needs improvement
-            for char in text:
-                if char in devanagari_to_iast:
-                    result += devanagari_to_iast[char]
-                else:
-                    result += char
-        
+            result = ''.join(devanagari_to_iast.get(char, char) for char in text)
+
         return result
     
     def tokenize(self, text: str) -> List[str]:
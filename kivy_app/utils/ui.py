@@ -0,0 +1,24 @@
+"""
+UI Helper Module.
+Small shared callbacks and constants used by screen builders.
+"""
+
+# Shared widget palette. Tuple literals compile to constants, but one
+# named definition keeps every screen on the same RGBA values instead
+# of eight copies drifting independently
+COLOR_GRAY = (0.3, 0.3, 0.3, 1)
+COLOR_BLUE = (0.2, 0.6, 0.8, 1)
+COLOR_GREEN = (0.2, 0.7, 0.3, 1)
+COLOR_RED = (0.7, 0.3, 0.3, 1)
+
+
+def sync_text_size(instance, value):
+    """
+    Mirror a label's size into its text_size.
+
+    Bound instead of instance.setter('text_size'): setter() returns a
+    fresh closure on every call, so binding this single shared function
+    avoids one allocation per label per build and keeps the handler
+    unbindable by identity.
+    """
+    instance.text_size = value
@@ -110,10 +110,12 @@ class SystemMonitorApp(App):
         self.monitor.update()
         # Store the data for historical tracking
         self.storage.store_data(self.monitor.get_all_data())
-        # Trigger UI updates
+        # Trigger UI updates; one getattr replaces the hasattr probe
+        # plus second attribute walk per tab in this once-a-second loop
         for tab in self.tabbed_panel.tab_list:
-            if hasattr(tab.content, 'update_display'):
-                tab.content.update_display()
+            update_display = getattr(tab.content, 'update_display', None)
+            if update_display is not None:
+                update_display()
     
     def launch_ElAiAss(self, *args):
         from kivy_app.main import ElAiApp